@@ -3,6 +3,7 @@
 Debug script to check GCS paths and list CSV files
 """
 
+import fnmatch
 import json
 import logging
 from sys import path
@@ -19,6 +20,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _summarize(reader: CSVReader, prefix: str, head: int = 5) -> None:
+    """Print file and CSV counts under a prefix, with the first few of each"""
+    all_files = [blob["name"] for blob in reader._list_blobs_cached(prefix)]
+    csv_files = [name for name in all_files if name[-4:].lower() == ".csv"]
+
+    print(f"All files in path: {len(all_files)}")
+    for file in all_files[:head]:
+        print(f"  - {file}")
+    if len(all_files) > head:
+        print(f"  ... and {len(all_files) - head} more")
+
+    print(f"\nCSV files in path: {len(csv_files)}")
+    for file in csv_files[:head]:
+        print(f"  - {file}")
+    if len(csv_files) > head:
+        print(f"  ... and {len(csv_files) - head} more")
+
+
 def main():
     # Load configuration
     with open("../config.json", "r") as f:
@@ -43,10 +62,10 @@ def main():
 
     # List all blobs in the bucket to see the structure
     print("\n=== Listing bucket structure ===")
-    blobs = csv_reader.bucket.list_blobs()
+    bucket_blobs = csv_reader._list_blobs_cached("")
     paths = set()
-    for blob in blobs:
-        path_parts = blob.name.split("/")
+    for blob in bucket_blobs:
+        path_parts = blob["name"].split("/")
         if len(path_parts) >= 3:
             paths.add("/".join(path_parts[:3]))
 
@@ -60,62 +79,23 @@ def main():
 
     print(f"\n=== Checking configured service path: {service_gcs_path} ===")
 
-    # List all files in the service path
-    blobs = csv_reader.bucket.list_blobs(prefix=service_gcs_path)
-    all_files = []
-    csv_files = []
-
-    for blob in blobs:
-        all_files.append(blob.name)
-        if blob.name.lower().endswith(".csv"):
-            csv_files.append(blob.name)
-
-    print(f"All files in path: {len(all_files)}")
-    for file in all_files[:5]:  # Show first 5 files
-        print(f"  - {file}")
-    if len(all_files) > 5:
-        print(f"  ... and {len(all_files) - 5} more")
-
-    print(f"\nCSV files in path: {len(csv_files)}")
-    for file in csv_files[:5]:  # Show first 5 CSV files
-        print(f"  - {file}")
-    if len(csv_files) > 5:
-        print(f"  ... and {len(csv_files) - 5} more")
+    _summarize(csv_reader, service_gcs_path)
 
     # Check the actual path that seems to exist in GCS
     actual_path = f"csvextract/dev_question_bank_service"
     print(f"\n=== Checking actual path: {actual_path} ===")
 
-    blobs = csv_reader.bucket.list_blobs(prefix=actual_path)
-    all_files = []
-    csv_files = []
-
-    for blob in blobs:
-        all_files.append(blob.name)
-        if blob.name.lower().endswith(".csv"):
-            csv_files.append(blob.name)
-
-    print(f"All files in path: {len(all_files)}")
-    for file in all_files[:5]:  # Show first 5 files
-        print(f"  - {file}")
-    if len(all_files) > 5:
-        print(f"  ... and {len(all_files) - 5} more")
-
-    print(f"\nCSV files in path: {len(csv_files)}")
-    for file in csv_files[:5]:  # Show first 5 CSV files
-        print(f"  - {file}")
-    if len(csv_files) > 5:
-        print(f"  ... and {len(csv_files) - 5} more")
+    _summarize(csv_reader, actual_path)
 
     # Check the path you mentioned
     mentioned_path = f"sql-exports/20251201/csvextract"
     print(f"\n=== Checking path you mentioned: {mentioned_path} ===")
 
     # List all directories under this path
-    blobs = csv_reader.bucket.list_blobs(prefix=mentioned_path)
+    blobs = csv_reader._list_blobs_cached(mentioned_path)
     paths = set()
     for blob in blobs:
-        path_parts = blob.name.split("/")
+        path_parts = blob["name"].split("/")
         if len(path_parts) >= 4:
             paths.add("/".join(path_parts[:4]))
 
@@ -129,26 +109,7 @@ def main():
         f"\n=== Checking specifically for dev-question-bank-service under {mentioned_path} ==="
     )
 
-    blobs = csv_reader.bucket.list_blobs(prefix=question_bank_path)
-    all_files = []
-    csv_files = []
-
-    for blob in blobs:
-        all_files.append(blob.name)
-        if blob.name.lower().endswith(".csv"):
-            csv_files.append(blob.name)
-
-    print(f"All files in path: {len(all_files)}")
-    for file in all_files[:5]:  # Show first 5 files
-        print(f"  - {file}")
-    if len(all_files) > 5:
-        print(f"  ... and {len(all_files) - 5} more")
-
-    print(f"\nCSV files in path: {len(csv_files)}")
-    for file in csv_files[:5]:  # Show first 5 CSV files
-        print(f"  - {file}")
-    if len(csv_files) > 5:
-        print(f"  ... and {len(csv_files) - 5} more")
+    _summarize(csv_reader, question_bank_path)
 
     # Check if the path has any variations
     print("\n=== Checking variations of the path ===")
@@ -164,10 +125,19 @@ def main():
         f"csvextract/question-bank-service",
     ]
 
+    # Every variation lives somewhere in the bucket listing taken above, so
+    # answer them all from it instead of issuing a list request per pattern
+    csv_names = [
+        blob["name"]
+        for blob in bucket_blobs
+        if blob["name"][-4:].lower() == ".csv"
+    ]
     for variation in variations:
         print(f"\nChecking: {variation}")
-        blobs = csv_reader.bucket.list_blobs(prefix=variation.rstrip("/*"))
-        count = sum(1 for blob in blobs if blob.name.lower().endswith(".csv"))
+        if "*" in variation:
+            count = len(fnmatch.filter(csv_names, variation))
+        else:
+            count = sum(1 for name in csv_names if name.startswith(variation))
         print(f"CSV files found: {count}")
 
 
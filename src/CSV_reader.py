@@ -4,13 +4,154 @@ CSV reader module for processing CSV files from Google Cloud Storage
 
 import logging
 import os
-from typing import Dict, List, Optional, Tuple
+import re
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 from google.cloud import storage
+from requests.adapters import HTTPAdapter
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
 
 logger = logging.getLogger(__name__)
 
+# Initial and maximum byte ranges fetched from GCS when sampling a CSV for
+# schema inference; the range doubles until it holds sample_size rows
+_SCHEMA_SAMPLE_BYTES = 2 << 20
+_SCHEMA_SAMPLE_MAX_BYTES = 64 << 20
+
+# BigQuery type for each numpy dtype kind; anything else maps to STRING
+_KIND_TO_BQ = {
+    "i": "INTEGER",
+    "u": "INTEGER",
+    "f": "FLOAT",
+    "b": "BOOLEAN",
+    "M": "TIMESTAMP",
+    "O": "STRING",
+    "U": "STRING",
+    "S": "STRING",
+}
+
+# Server-side filter so GCS only returns CSV objects (case-insensitive suffix)
+_CSV_MATCH_GLOB = "**.[cC][sS][vV]"
+
+# Seconds a cached GCS listing stays valid
+_LISTING_CACHE_TTL = 30
+
+# Most file versions whose inferred schema is kept in memory
+_SCHEMA_CACHE_SIZE = 4096
+
+# Prisma migration exports share the CSV suffix but are not table data
+_PRISMA_RE = re.compile(r"(?i)prisma")
+
+# Block size for pyarrow's streaming CSV reader when sampling rows
+_ARROW_BLOCK_BYTES = 1 << 20
+
+# Read size used when scanning raw CSV bytes for row counting
+_COUNT_CHUNK_BYTES = 1 << 20
+
+
+def _is_csv_name(name: str) -> bool:
+    """True for CSV file names, excluding prisma migration exports"""
+    # Lowercase only the 4-char suffix; the prisma scan runs only for CSVs
+    return name[-4:].lower() == ".csv" and not _PRISMA_RE.search(name)
+
+
+def _bq_type(dtype: Any) -> str:
+    """
+    BigQuery type for a DataFrame column dtype
+
+    Arrow-backed columns from _read_csv carry date and time-of-day types
+    that numpy dtype kinds would report as TIMESTAMP or STRING; they map to
+    DATE and TIME, matching BigQuery's CSV autodetect.
+    """
+    if pa is not None and isinstance(dtype, pd.ArrowDtype):
+        arrow_type = dtype.pyarrow_dtype
+        if pa.types.is_date(arrow_type):
+            return "DATE"
+        if pa.types.is_time(arrow_type):
+            return "TIME"
+    return _KIND_TO_BQ.get(dtype.kind, "STRING")
+
+
+def _read_csv(source: Any, nrows: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read CSV data into a DataFrame, preferring pyarrow's multithreaded parser
+
+    With nrows set, pyarrow streams one block at a time and stops as soon as
+    enough rows have been parsed. Falls back to the pandas C engine when
+    pyarrow is unavailable or cannot parse the data.
+
+    Args:
+        source: Local path or binary file object (seekable for the fallback)
+        nrows: Optional number of rows to read
+
+    Returns:
+        pandas DataFrame with the CSV data
+    """
+    if pa_csv is not None:
+        try:
+            parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+            if nrows is not None:
+                reader = pa_csv.open_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(block_size=_ARROW_BLOCK_BYTES),
+                    parse_options=parse_options,
+                )
+                batches = []
+                rows = 0
+                for batch in reader:
+                    batches.append(batch)
+                    rows += batch.num_rows
+                    if rows >= nrows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                table = table.slice(0, nrows)
+            else:
+                table = pa_csv.read_csv(source, parse_options=parse_options)
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        except (pa.ArrowException, ValueError) as e:
+            logger.debug(f"pyarrow CSV parse failed, using pandas engine: {e}")
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+    return pd.read_csv(source, nrows=nrows, low_memory=False, encoding="utf-8")
+
+
+def _count_data_rows(fh) -> int:
+    """
+    Count data rows in a binary CSV stream by counting newlines
+
+    Quoted fields containing newlines are counted as several rows, so this is
+    only exact for files without embedded newlines.
+
+    Args:
+        fh: File object opened in binary mode
+
+    Returns:
+        Number of rows excluding the header
+    """
+    newlines = 0
+    last_byte = b""
+    for chunk in iter(lambda: fh.read(_COUNT_CHUNK_BYTES), b""):
+        newlines += chunk.count(b"\n")
+        last_byte = chunk[-1:]
+
+    # Final row without a trailing newline
+    if last_byte and last_byte != b"\n":
+        newlines += 1
+
+    return max(newlines - 1, 0)
+
 
 class CSVReader:
     """Reader for processing CSV files from GCS or local filesystem"""
@@ -29,6 +170,22 @@ class CSVReader:
         """
         self.gcs_bucket = gcs_bucket
 
+        # Cache of GCS listings: (prefix, match_glob) -> (fetched_at, entries)
+        self._listing_cache: Dict[
+            Tuple[str, Optional[str]], Tuple[float, List[Dict[str, Any]]]
+        ] = {}
+        self._listing_cache_lock = threading.Lock()
+
+        # Latest listing entry per object name: name -> (fetched_at, entry)
+        self._blob_index: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Inferred schemas keyed by file version: (path, size, updated, sample_size),
+        # least recently used first
+        self._schema_cache: "OrderedDict[Tuple[Any, ...], Dict[str, str]]" = (
+            OrderedDict()
+        )
+        self._schema_cache_lock = threading.Lock()
+
         # Initialize GCS client if bucket is provided
         if gcs_bucket:
             if service_account_path:
@@ -37,6 +194,16 @@ class CSVReader:
                 )
             else:
                 self.gcs_client = storage.Client()
+
+            # Increase connection pool size so parallel downloads reuse sockets
+            if "GOOGLE_CLOUD_CONNECTION_POOL_SIZE" in os.environ:
+                pool_size = int(os.environ["GOOGLE_CLOUD_CONNECTION_POOL_SIZE"])
+            else:
+                pool_size = 50
+
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.gcs_client._http.mount("https://", adapter)
+
             self.bucket = self.gcs_client.bucket(gcs_bucket)
             logger.info(f"GCS client initialized for bucket: {gcs_bucket}")
         else:
@@ -44,12 +211,150 @@ class CSVReader:
             self.bucket = None
             logger.info("CSV Reader initialized for local filesystem")
 
-    def list_csv_files_in_gcs(self, gcs_path: str) -> List[str]:
+    def _list_blobs_cached(
+        self,
+        prefix: str,
+        match_glob: Optional[str] = None,
+        ttl: float = _LISTING_CACHE_TTL,
+        use_cache: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        List blobs under a prefix, reusing a recent listing when available
+
+        The size and timestamps are populated by the list response itself,
+        so no per-blob reload() is needed.
+
+        Args:
+            prefix: GCS prefix to list
+            match_glob: Optional glob evaluated by GCS to filter object names
+            ttl: Seconds a cached listing stays valid
+            use_cache: If False, always hit GCS (the result is still cached)
+
+        Returns:
+            List of dictionaries with name, size, time_created, updated and
+            generation
+        """
+        key = (prefix, match_glob)
+        now = time.monotonic()
+        if use_cache:
+            with self._listing_cache_lock:
+                cached = self._listing_cache.get(key)
+            if cached and now - cached[0] < ttl:
+                return cached[1]
+
+        entries = [
+            {
+                "name": blob.name,
+                "size": blob.size,
+                "time_created": blob.time_created,
+                "updated": blob.updated,
+                "generation": blob.generation,
+            }
+            for blob in self.bucket.list_blobs(prefix=prefix, match_glob=match_glob)
+        ]
+
+        with self._listing_cache_lock:
+            # Drop expired listings so the cache doesn't grow with every
+            # prefix and glob seen over a long run
+            for stale_key in [
+                k
+                for k, (fetched_at, _) in self._listing_cache.items()
+                if now - fetched_at >= _LISTING_CACHE_TTL
+            ]:
+                del self._listing_cache[stale_key]
+            for stale_name in [
+                name
+                for name, (fetched_at, _) in self._blob_index.items()
+                if now - fetched_at >= _LISTING_CACHE_TTL
+            ]:
+                del self._blob_index[stale_name]
+
+            self._listing_cache[key] = (now, entries)
+            for entry in entries:
+                self._blob_index[entry["name"]] = (now, entry)
+        return entries
+
+    def cache_clear(self) -> None:
+        """Drop all cached GCS listings"""
+        with self._listing_cache_lock:
+            self._listing_cache.clear()
+            self._blob_index.clear()
+
+    def clear_schema_cache(self) -> None:
+        """Drop all cached schema inference results"""
+        with self._schema_cache_lock:
+            self._schema_cache.clear()
+
+    def _lookup_blob_entry(self, gcs_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the listing entry for a single object in recent listings
+
+        Files seen while listing their folder cost no extra request; others
+        are not looked up, since a list call per file would cost more than
+        the schema cache saves.
+
+        Args:
+            gcs_path: GCS path to the object
+
+        Returns:
+            Listing entry dictionary, or None if the object was not listed
+            recently
+        """
+        with self._listing_cache_lock:
+            indexed = self._blob_index.get(gcs_path)
+        if indexed and time.monotonic() - indexed[0] < _LISTING_CACHE_TTL:
+            return indexed[1]
+        return None
+
+    def get_generations(self, gcs_paths: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get the GCS generation of files from recent listings
+
+        Args:
+            gcs_paths: GCS paths to look up
+
+        Returns:
+            Dictionary mapping each path to its generation, or None for files
+            not listed recently
+        """
+        generations: Dict[str, Optional[str]] = {}
+        for gcs_path in gcs_paths:
+            entry = self._lookup_blob_entry(gcs_path)
+            generation = entry.get("generation") if entry else None
+            generations[gcs_path] = str(generation) if generation else None
+        return generations
+
+    def _get_cached_schema(
+        self, key: Optional[Tuple[Any, ...]]
+    ) -> Optional[Dict[str, str]]:
+        """Return a copy of a cached schema, or None on a miss"""
+        if key is None:
+            return None
+        with self._schema_cache_lock:
+            schema = self._schema_cache.get(key)
+            if schema is not None:
+                self._schema_cache.move_to_end(key)
+        return dict(schema) if schema is not None else None
+
+    def _store_cached_schema(
+        self, key: Optional[Tuple[Any, ...]], schema: Dict[str, str]
+    ) -> None:
+        """Remember a schema for a file version"""
+        if key is None or not schema:
+            return
+        with self._schema_cache_lock:
+            self._schema_cache[key] = dict(schema)
+            self._schema_cache.move_to_end(key)
+            while len(self._schema_cache) > _SCHEMA_CACHE_SIZE:
+                self._schema_cache.popitem(last=False)
+
+    def list_csv_files_in_gcs(self, gcs_path: str, use_cache: bool = True) -> List[str]:
         """
         List all CSV files in a GCS path
 
         Args:
             gcs_path: GCS path (folder) to search for CSV files
+            use_cache: Reuse a recent listing of the same path if available
 
         Returns:
             List of CSV file paths in GCS
@@ -63,12 +368,12 @@ class CSVReader:
             if gcs_path.startswith("/"):
                 gcs_path = gcs_path[1:]
 
-            blobs = self.bucket.list_blobs(prefix=gcs_path)
+            # GCS filters on the suffix; the prisma exclusion has no glob form
+            entries = self._list_blobs_cached(
+                gcs_path, match_glob=_CSV_MATCH_GLOB, use_cache=use_cache
+            )
             csv_files = [
-                blob.name
-                for blob in blobs
-                if blob.name.lower().endswith(".csv")
-                and "prisma" not in blob.name.lower()
+                entry["name"] for entry in entries if _is_csv_name(entry["name"])
             ]
 
             logger.info(f"Found {len(csv_files)} CSV files in GCS path: {gcs_path}")
@@ -77,6 +382,39 @@ class CSVReader:
             logger.error(f"Error listing CSV files in GCS path {gcs_path}: {e}")
             return []
 
+    def list_csv_files_by_service(
+        self,
+        gcs_base_path: str,
+        service_folders: Dict[str, str],
+        use_cache: bool = True,
+    ) -> Dict[str, List[str]]:
+        """
+        List the CSV files of several services with one GCS listing
+
+        Each service is expected to own a folder directly under
+        gcs_base_path, e.g. "<gcs_base_path>/<folder>/table.csv".
+
+        Args:
+            gcs_base_path: GCS path (folder) holding one folder per service
+            service_folders: Folder name under gcs_base_path -> service name
+            use_cache: Reuse a recent listing of the same path if available
+
+        Returns:
+            Dictionary mapping each service to its CSV file paths
+        """
+        files_by_service: Dict[str, List[str]] = {
+            service: [] for service in service_folders.values()
+        }
+
+        prefix = gcs_base_path.lstrip("/")
+        for csv_file in self.list_csv_files_in_gcs(prefix, use_cache=use_cache):
+            folder = csv_file[len(prefix) :].lstrip("/").split("/", 1)[0]
+            service = service_folders.get(folder)
+            if service is not None:
+                files_by_service[service].append(csv_file)
+
+        return files_by_service
+
     def list_csv_files_local(self, directory_path: str) -> List[str]:
         """
         List all CSV files in a local directory
@@ -89,10 +427,17 @@ class CSVReader:
         """
         try:
             csv_files = []
-            for root, _, files in os.walk(directory_path):
-                for file in files:
-                    if file.lower().endswith(".csv") and "prisma" not in file.lower():
-                        csv_files.append(os.path.join(root, file))
+
+            # Walk with scandir so file/dir checks reuse the cached readdir type
+            stack = [directory_path]
+            while stack:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            if _is_csv_name(entry.name):
+                                csv_files.append(entry.path)
 
             logger.info(
                 f"Found {len(csv_files)} CSV files in local directory: {directory_path}"
@@ -104,12 +449,15 @@ class CSVReader:
             )
             return []
 
-    def get_csv_metadata_from_gcs(self, gcs_path: str) -> List[Dict[str, str]]:
+    def get_csv_metadata_from_gcs(
+        self, gcs_path: str, use_cache: bool = True
+    ) -> List[Dict[str, str]]:
         """
         Get metadata for CSV files in GCS
 
         Args:
             gcs_path: GCS path (folder) containing CSV files
+            use_cache: Reuse a recent listing of the same path if available
 
         Returns:
             List of dictionaries with file metadata
@@ -119,22 +467,31 @@ class CSVReader:
             return []
 
         try:
-            csv_files = self.list_csv_files_in_gcs(gcs_path)
+            if gcs_path.startswith("/"):
+                gcs_path = gcs_path[1:]
+
             metadata = []
 
-            for file_path in csv_files:
-                blob = self.bucket.blob(file_path)
-                blob.reload()  # Fetch the latest metadata
+            # The listing already carries size and timestamps for each blob
+            entries = self._list_blobs_cached(
+                gcs_path, match_glob=_CSV_MATCH_GLOB, use_cache=use_cache
+            )
+            for entry in entries:
+                file_path = entry["name"]
+                if not _is_csv_name(file_path):
+                    continue
 
                 metadata.append(
                     {
                         "path": file_path,
                         "name": os.path.basename(file_path),
-                        "size": blob.size,
-                        "created": blob.time_created.isoformat()
-                        if blob.time_created
+                        "size": entry["size"],
+                        "created": entry["time_created"].isoformat()
+                        if entry["time_created"]
+                        else None,
+                        "updated": entry["updated"].isoformat()
+                        if entry["updated"]
                         else None,
-                        "updated": blob.updated.isoformat() if blob.updated else None,
                     }
                 )
 
@@ -177,7 +534,7 @@ class CSVReader:
             return []
 
     def extract_schema_from_csv_gcs(
-        self, gcs_path: str, sample_size: int = 1000
+        self, gcs_path: str, sample_size: int = 1000, use_cache: bool = True
     ) -> Dict[str, str]:
         """
         Extract schema from a CSV file in GCS by sampling a few rows
@@ -185,6 +542,7 @@ class CSVReader:
         Args:
             gcs_path: GCS path to the CSV file
             sample_size: Number of rows to sample for schema detection
+            use_cache: Reuse the schema inferred for the same file version
 
         Returns:
             Dictionary with column names as keys and inferred data types as values
@@ -194,35 +552,48 @@ class CSVReader:
             return {}
 
         try:
-            # Download a small portion of the file for schema detection
+            # Key the cache on the object version taken from the listing
+            cache_key = None
+            if use_cache:
+                entry = self._lookup_blob_entry(gcs_path)
+                if entry:
+                    cache_key = (gcs_path, entry["size"], entry["updated"], sample_size)
+                cached = self._get_cached_schema(cache_key)
+                if cached is not None:
+                    return cached
+
+            # Download only the head of the file for schema detection
             blob = self.bucket.blob(gcs_path)
-
-            # Download the file content as bytes
-            content = blob.download_as_bytes()
-
-            # Use pandas to infer schema
-            from io import StringIO
-
-            df = pd.read_csv(
-                StringIO(content.decode("utf-8")),
-                nrows=sample_size,
-                low_memory=False,
-            )
-
-            schema = {}
-            for column in df.columns:
-                dtype = df[column].dtype
-                if pd.api.types.is_integer_dtype(dtype):
-                    schema[column] = "INTEGER"
-                elif pd.api.types.is_float_dtype(dtype):
-                    schema[column] = "FLOAT"
-                elif pd.api.types.is_bool_dtype(dtype):
-                    schema[column] = "BOOLEAN"
-                elif pd.api.types.is_datetime64_dtype(dtype):
-                    schema[column] = "TIMESTAMP"
-                else:
-                    schema[column] = "STRING"
-
+            probe_bytes = _SCHEMA_SAMPLE_BYTES
+            while True:
+                content = blob.download_as_bytes(start=0, end=probe_bytes - 1)
+
+                # A full range means the file was cut short, so drop the
+                # trailing partial row before handing the bytes to pandas
+                truncated = len(content) >= probe_bytes
+                if truncated:
+                    last_newline = content.rfind(b"\n")
+                    if last_newline > 0:
+                        content = content[: last_newline + 1]
+
+                can_grow = truncated and probe_bytes < _SCHEMA_SAMPLE_MAX_BYTES
+                try:
+                    # Use pandas to infer schema
+                    df = _read_csv(BytesIO(content), nrows=sample_size)
+                except Exception:
+                    # The cut may have split a quoted multi-line value
+                    if not can_grow:
+                        raise
+                    probe_bytes *= 2
+                    continue
+
+                if len(df) >= sample_size or not can_grow:
+                    break
+                probe_bytes *= 2
+
+            schema = {column: _bq_type(dtype) for column, dtype in df.dtypes.items()}
+
+            self._store_cached_schema(cache_key, schema)
             logger.info(f"Extracted schema for {gcs_path}: {schema}")
             return schema
         except Exception as e:
@@ -230,7 +601,7 @@ class CSVReader:
             return {}
 
     def extract_schema_from_csv_local(
-        self, file_path: str, sample_size: int = 1000
+        self, file_path: str, sample_size: int = 1000, use_cache: bool = True
     ) -> Dict[str, str]:
         """
         Extract schema from a local CSV file by sampling a few rows
@@ -238,32 +609,26 @@ class CSVReader:
         Args:
             file_path: Local path to the CSV file
             sample_size: Number of rows to sample for schema detection
+            use_cache: Reuse the schema inferred for the same file version
 
         Returns:
             Dictionary with column names as keys and inferred data types as values
         """
         try:
+            cache_key = None
+            if use_cache:
+                stat = os.stat(file_path)
+                cache_key = (file_path, stat.st_size, stat.st_mtime_ns, sample_size)
+                cached = self._get_cached_schema(cache_key)
+                if cached is not None:
+                    return cached
+
             # Use pandas to infer schema
-            df = pd.read_csv(
-                file_path,
-                nrows=sample_size,
-                low_memory=False,
-            )
+            df = _read_csv(file_path, nrows=sample_size)
 
-            schema = {}
-            for column in df.columns:
-                dtype = df[column].dtype
-                if pd.api.types.is_integer_dtype(dtype):
-                    schema[column] = "INTEGER"
-                elif pd.api.types.is_float_dtype(dtype):
-                    schema[column] = "FLOAT"
-                elif pd.api.types.is_bool_dtype(dtype):
-                    schema[column] = "BOOLEAN"
-                elif pd.api.types.is_datetime64_dtype(dtype):
-                    schema[column] = "TIMESTAMP"
-                else:
-                    schema[column] = "STRING"
+            schema = {column: _bq_type(dtype) for column, dtype in df.dtypes.items()}
 
+            self._store_cached_schema(cache_key, schema)
             logger.info(f"Extracted schema for {file_path}: {schema}")
             return schema
         except Exception as e:
@@ -288,21 +653,10 @@ class CSVReader:
             return pd.DataFrame()
 
         try:
-            # Download the file content as bytes using the GCS client
+            # Stream the blob so pandas stops reading once nrows is satisfied
             blob = self.bucket.blob(gcs_path)
-            content = blob.download_as_bytes()
-
-            # Read with pandas from bytes
-            from io import StringIO
-
-            if sample_size:
-                df = pd.read_csv(
-                    StringIO(content.decode("utf-8")),
-                    nrows=sample_size,
-                    low_memory=False,
-                )
-            else:
-                df = pd.read_csv(StringIO(content.decode("utf-8")), low_memory=False)
+            with blob.open("rb") as fh:
+                df = _read_csv(fh, nrows=sample_size)
 
             logger.info(f"Read CSV from GCS: {gcs_path}, shape: {df.shape}")
             return df
@@ -324,11 +678,7 @@ class CSVReader:
             pandas DataFrame with the CSV data
         """
         try:
-            # Read with pandas
-            if sample_size:
-                df = pd.read_csv(file_path, nrows=sample_size, low_memory=False)
-            else:
-                df = pd.read_csv(file_path, low_memory=False)
+            df = _read_csv(file_path, nrows=sample_size)
 
             logger.info(f"Read local CSV: {file_path}, shape: {df.shape}")
             return df
@@ -336,28 +686,59 @@ class CSVReader:
             logger.error(f"Error reading local CSV {file_path}: {e}")
             return pd.DataFrame()
 
-    def get_row_count_gcs(self, gcs_path: str) -> int:
+    def get_row_count_gcs(
+        self, gcs_path: str, allow_quoted_newlines: bool = True
+    ) -> int:
         """
         Get the row count of a CSV file in GCS
 
         Args:
             gcs_path: GCS path to the CSV file
+            allow_quoted_newlines: If False, count raw newlines instead of
+                parsing the file (faster, but wrong for embedded newlines)
 
         Returns:
             Number of rows in the CSV file
         """
-        df = self.read_csv_to_dataframe_gcs(gcs_path)
-        return len(df)
+        if not self.gcs_client:
+            logger.error("GCS client not initialized")
+            return 0
+
+        try:
+            blob = self.bucket.blob(gcs_path)
+            with blob.open("rb") as fh:
+                if not allow_quoted_newlines:
+                    return _count_data_rows(fh)
 
-    def get_row_count_local(self, file_path: str) -> int:
+                # Parse a single column so quoted newlines are still honoured
+                df = pd.read_csv(fh, usecols=[0], dtype=str, encoding="utf-8")
+                return len(df)
+        except Exception as e:
+            logger.error(f"Error counting rows in GCS {gcs_path}: {e}")
+            return 0
+
+    def get_row_count_local(
+        self, file_path: str, allow_quoted_newlines: bool = True
+    ) -> int:
         """
         Get the row count of a local CSV file
 
         Args:
             file_path: Local path to the CSV file
+            allow_quoted_newlines: If False, count raw newlines instead of
+                parsing the file (faster, but wrong for embedded newlines)
 
         Returns:
             Number of rows in the CSV file
         """
-        df = self.read_csv_to_dataframe_local(file_path)
-        return len(df)
+        try:
+            if not allow_quoted_newlines:
+                with open(file_path, "rb") as fh:
+                    return _count_data_rows(fh)
+
+            # Parse a single column so quoted newlines are still honoured
+            df = pd.read_csv(file_path, usecols=[0], dtype=str)
+            return len(df)
+        except Exception as e:
+            logger.error(f"Error counting rows in local CSV {file_path}: {e}")
+            return 0
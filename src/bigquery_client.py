@@ -2,14 +2,46 @@
 BigQuery client module for connecting to and managing BigQuery resources
 """
 
+import concurrent.futures
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
-from google.api_core.exceptions import GoogleAPIError
+from google.api_core.exceptions import GoogleAPIError, NotFound
 from google.cloud import bigquery
+from requests.adapters import HTTPAdapter
+
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # optional: faster Arrow reads in read_table_arrow
+    bigquery_storage = None
+
+if TYPE_CHECKING:
+    import pyarrow
 
 logger = logging.getLogger(__name__)
 
+# How long upsert staging tables live before BigQuery removes them
+_TEMP_TABLE_TTL = timedelta(hours=1)
+
+# INFORMATION_SCHEMA reports standard SQL type names; table metadata (and so
+# get_table_info) uses the legacy names the validators compare against
+_LEGACY_TYPE_NAMES = {"INT64": "INTEGER", "FLOAT64": "FLOAT", "BOOL": "BOOLEAN"}
+
+
+def _legacy_type_name(data_type: str) -> str:
+    """Convert an INFORMATION_SCHEMA data_type to its table-metadata name"""
+    if data_type.startswith("ARRAY<"):
+        # Repeated fields report their element type in table metadata
+        data_type = data_type[len("ARRAY<") : -1]
+    if data_type.startswith("STRUCT<"):
+        return "RECORD"
+    # Drop parameters such as STRING(10) or NUMERIC(10, 2)
+    base = data_type.split("(", 1)[0]
+    return _LEGACY_TYPE_NAMES.get(base, base)
+
 
 class BigQueryClient:
     """Client for interacting with Google BigQuery"""
@@ -28,6 +60,27 @@ class BigQueryClient:
         self.project_id = project_id
         self.location = location
 
+        # Tables fetched during this run; None records a table known not to exist
+        self._table_cache: Dict[Tuple[str, str], Optional[bigquery.Table]] = {}
+        self._table_cache_lock = threading.Lock()
+
+        # Tables known to exist, so existence checks survive the cache being
+        # invalidated after a write (a load never removes its destination)
+        self._known_tables: Set[Tuple[str, str]] = set()
+
+        # Upsert temp tables whose expiration could not be set; they are
+        # deleted once their MERGE finishes instead
+        self._unexpired_temp_tables: Set[Tuple[str, str]] = set()
+
+        # Load schemas built from inferred CSV shapes, keyed by (column, type) pairs
+        self._schema_field_cache: Dict[
+            Tuple[Tuple[str, str], ...], List[bigquery.SchemaField]
+        ] = {}
+
+        # Storage Read API client, created on first read_table_arrow call
+        self._bqstorage_client = None
+        self._bqstorage_lock = threading.Lock()
+
         # Initialize client with authentication
         if service_account_path:
             self.client = bigquery.Client.from_service_account_json(
@@ -38,14 +91,15 @@ class BigQueryClient:
             self.client = bigquery.Client(project=project_id)
 
         # Increase connection pool size to handle parallel operations
-        import os
-
         if "GOOGLE_CLOUD_CONNECTION_POOL_SIZE" in os.environ:
             pool_size = int(os.environ["GOOGLE_CLOUD_CONNECTION_POOL_SIZE"])
         else:
             pool_size = 50  # Increase default to 50 to handle parallel operations
 
-        self.client._http_connection_pool_size = pool_size
+        # Mount the pool on the authorized session the client actually uses, so
+        # parallel jobs share keep-alive connections instead of re-handshaking
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.client._http.mount("https://", adapter)
 
         logger.info(f"BigQuery client initialized for project: {project_id}")
 
@@ -72,6 +126,43 @@ class BigQueryClient:
             logger.error(f"Error creating dataset {dataset_name}: {e}")
             return False
 
+    def _get_table(
+        self, dataset_name: str, table_name: str, force: bool = False
+    ) -> Optional[bigquery.Table]:
+        """
+        Fetch a table, reusing the result of an earlier lookup in this run
+
+        Args:
+            dataset_name: Name of the dataset
+            table_name: Name of the table
+            force: If True, bypass the cache and refetch from BigQuery
+
+        Returns:
+            The Table (including its schema), or None if it does not exist
+        """
+        key = (dataset_name, table_name)
+        if not force:
+            with self._table_cache_lock:
+                if key in self._table_cache:
+                    return self._table_cache[key]
+
+        table_ref = self.client.dataset(dataset_name).table(table_name)
+        try:
+            table = self.client.get_table(table_ref)
+        except NotFound:
+            table = None
+
+        with self._table_cache_lock:
+            self._table_cache[key] = table
+            if table is not None:
+                self._known_tables.add(key)
+        return table
+
+    def _invalidate_table(self, dataset_name: str, table_name: str) -> None:
+        """Forget the cached lookup for a table after it has been modified"""
+        with self._table_cache_lock:
+            self._table_cache.pop((dataset_name, table_name), None)
+
     def table_exists(self, dataset_name: str, table_name: str) -> bool:
         """
         Check if a table exists in BigQuery
@@ -83,42 +174,120 @@ class BigQueryClient:
         Returns:
             True if table exists, False otherwise
         """
-        try:
-            from google.cloud.exceptions import NotFound
-
-            dataset_ref = self.client.dataset(dataset_name)
-            table_ref = dataset_ref.table(table_name)
-            try:
-                self.client.get_table(table_ref)
+        with self._table_cache_lock:
+            if (dataset_name, table_name) in self._known_tables:
                 return True
-            except NotFound:
-                return False
+        try:
+            return self._get_table(dataset_name, table_name) is not None
         except Exception as e:
             logger.error(f"Error checking if table exists: {e}")
             return False
 
-    def create_table_from_csv(
+    def list_table_names(self, dataset_name: str) -> Optional[Set[str]]:
+        """
+        List the names of all tables in a dataset with one paged request
+
+        Args:
+            dataset_name: Name of the dataset
+
+        Returns:
+            Set of table names (empty if the dataset is missing), or None on
+            error so callers can fall back to per-table lookups
+        """
+        try:
+            names = {
+                table.table_id
+                for table in self.client.list_tables(
+                    self.client.dataset(dataset_name), page_size=1000
+                )
+            }
+        except NotFound:
+            return set()
+        except GoogleAPIError as e:
+            logger.error(f"Error listing tables in dataset {dataset_name}: {e}")
+            return None
+
+        with self._table_cache_lock:
+            self._known_tables.update((dataset_name, name) for name in names)
+        return names
+
+    def infer_bq_schema(
+        self, csv_reader: Any, gcs_path: str
+    ) -> Optional[List[bigquery.SchemaField]]:
+        """
+        Build an explicit load schema from a sample of a CSV file in GCS
+
+        Passing the result to create_table_from_csv lets the load job skip
+        BigQuery's autodetect pass. The CSV reader caches inference per file
+        version, and files with the same shape share one field list. Only
+        this one file is sampled, so when several files load into a table
+        together the others are assumed to share its shape.
+
+        Args:
+            csv_reader: CSVReader used to sample the file
+            gcs_path: GCS path to the CSV file (without the gs://bucket/ prefix)
+
+        Returns:
+            List of NULLABLE SchemaFields, or None if the schema can't be inferred
+        """
+        schema = csv_reader.extract_schema_from_csv_gcs(gcs_path)
+        if not schema:
+            return None
+
+        signature = tuple(schema.items())
+        with self._table_cache_lock:
+            fields = self._schema_field_cache.get(signature)
+        if fields is None:
+            fields = [
+                bigquery.SchemaField(name, field_type, mode="NULLABLE")
+                for name, field_type in signature
+            ]
+            with self._table_cache_lock:
+                self._schema_field_cache[signature] = fields
+
+        return list(fields)
+
+    def get_table_fields(
+        self, dataset_name: str, table_name: str
+    ) -> Optional[List[bigquery.SchemaField]]:
+        """
+        Get the schema of an existing table as load-ready SchemaFields
+
+        Args:
+            dataset_name: Name of the dataset
+            table_name: Name of the table
+
+        Returns:
+            List of SchemaFields, or None if the table doesn't exist or has
+            no schema
+        """
+        table = self._get_table(dataset_name, table_name)
+        if table is None or not table.schema:
+            return None
+        return list(table.schema)
+
+    def submit_load_from_csv(
         self,
         dataset_name: str,
         table_name: str,
-        gcs_uri: str,
+        gcs_uri: Union[str, List[str]],
         schema: Optional[List[bigquery.SchemaField]] = None,
-        enforce_dataset_location: bool = True,
         write_disposition: str = "WRITE_TRUNCATE",
         location: Optional[str] = None,
-    ) -> bool:
+    ) -> Optional[bigquery.LoadJob]:
         """
-        Create a table in BigQuery from a CSV file in GCS
+        Submit a load job for CSV files in GCS without waiting for it
 
         Args:
             dataset_name: Name of the dataset
-            table_name: Name of the table to create
-            gcs_uri: GCS URI of the CSV file
+            table_name: Name of the table to load into
+            gcs_uri: GCS URI, wildcard URI, or list of URIs of the CSV files
             schema: Table schema (optional, will auto-detect if None)
             write_disposition: WRITE_TRUNCATE, WRITE_APPEND, or WRITE_EMPTY
+            location: Job location (defaults to the client's location)
 
         Returns:
-            True if table was created successfully, False otherwise
+            The running LoadJob, or None if submission failed
         """
         try:
             dataset_ref = self.client.dataset(dataset_name)
@@ -130,9 +299,8 @@ class BigQueryClient:
                 autodetect=True if schema is None else False,
                 schema=schema,
                 write_disposition=write_disposition,
-                # max_bad_records=1,  # Allow some errors
+                max_bad_records=0,  # Fail the load rather than drop rows
                 allow_quoted_newlines=True,
-
             )
 
             # Use the client's configured location for load jobs so temp tables
@@ -140,17 +308,140 @@ class BigQueryClient:
             # load jobs must run in the correct location/region. Use the
             # provided location or fall back to the client's configured one.
             resolved_location = location or self.location
-            load_job = self.client.load_table_from_uri(
+            return self.client.load_table_from_uri(
                 gcs_uri, table_ref, job_config=job_config, location=resolved_location
             )
+        except GoogleAPIError as e:
+            logger.error(
+                f"Error submitting load job for {dataset_name}.{table_name}: {e}"
+            )
+            return None
 
-            load_job.result()  # Wait for job to complete
+    def wait_loads(
+        self,
+        jobs: List[Optional[bigquery.LoadJob]],
+        timeout: Optional[float] = None,
+    ) -> List[bool]:
+        """
+        Wait for submitted load jobs to finish
 
-            logger.info(f"Table {dataset_name}.{table_name} created from {gcs_uri}")
-            return True
-        except GoogleAPIError as e:
-            logger.error(f"Error creating table {dataset_name}.{table_name}: {e}")
-            return False
+        The jobs run concurrently on the BigQuery side, so waiting on them in
+        turn takes as long as the slowest one.
+
+        Args:
+            jobs: Jobs returned by submit_load_from_csv (None counts as failed)
+            timeout: Optional per-job wait timeout in seconds
+
+        Returns:
+            List of success flags in the same order as jobs
+        """
+        results = []
+        for job in jobs:
+            if job is None:
+                results.append(False)
+                continue
+
+            dataset_name = job.destination.dataset_id
+            table_name = job.destination.table_id
+            try:
+                job.result(timeout=timeout)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Table {dataset_name}.{table_name} created from "
+                        f"{', '.join(job.source_uris)}"
+                    )
+                with self._table_cache_lock:
+                    self._known_tables.add((dataset_name, table_name))
+                results.append(True)
+            except (GoogleAPIError, concurrent.futures.TimeoutError) as e:
+                logger.error(f"Error creating table {dataset_name}.{table_name}: {e}")
+                results.append(False)
+            finally:
+                self._invalidate_table(dataset_name, table_name)
+
+        return results
+
+    def load_many(self, specs: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Load several CSV files, submitting every job before waiting on any
+
+        Args:
+            specs: Keyword arguments for submit_load_from_csv, one dict per load
+
+        Returns:
+            List of success flags in the same order as specs
+        """
+        jobs = [self.submit_load_from_csv(**spec) for spec in specs]
+        return self.wait_loads(jobs)
+
+    def create_table_from_csv(
+        self,
+        dataset_name: str,
+        table_name: str,
+        gcs_uri: str,
+        schema: Optional[List[bigquery.SchemaField]] = None,
+        enforce_dataset_location: bool = True,
+        write_disposition: str = "WRITE_TRUNCATE",
+        location: Optional[str] = None,
+    ) -> bool:
+        """
+        Create a table in BigQuery from a CSV file in GCS
+
+        Args:
+            dataset_name: Name of the dataset
+            table_name: Name of the table to create
+            gcs_uri: GCS URI of the CSV file
+            schema: Table schema (optional, will auto-detect if None)
+            write_disposition: WRITE_TRUNCATE, WRITE_APPEND, or WRITE_EMPTY
+
+        Returns:
+            True if table was created successfully, False otherwise
+        """
+        job = self.submit_load_from_csv(
+            dataset_name,
+            table_name,
+            gcs_uri,
+            schema=schema,
+            write_disposition=write_disposition,
+            location=location,
+        )
+        return self.wait_loads([job])[0]
+
+    def create_table_from_csv_multi(
+        self,
+        dataset_name: str,
+        table_name: str,
+        gcs_uris: Union[str, List[str]],
+        schema: Optional[List[bigquery.SchemaField]] = None,
+        write_disposition: str = "WRITE_TRUNCATE",
+        location: Optional[str] = None,
+    ) -> bool:
+        """
+        Create a table from several same-schema CSV files in a single load job
+
+        One job avoids a job-creation round-trip per file and lets BigQuery
+        read the files in parallel.
+
+        Args:
+            dataset_name: Name of the dataset
+            table_name: Name of the table to create
+            gcs_uris: List of GCS URIs, or a wildcard such as gs://bucket/path/*.csv
+            schema: Table schema (optional, will auto-detect if None)
+            write_disposition: WRITE_TRUNCATE, WRITE_APPEND, or WRITE_EMPTY
+            location: Job location (defaults to the client's location)
+
+        Returns:
+            True if table was created successfully, False otherwise
+        """
+        job = self.submit_load_from_csv(
+            dataset_name,
+            table_name,
+            gcs_uris,
+            schema=schema,
+            write_disposition=write_disposition,
+            location=location,
+        )
+        return self.wait_loads([job])[0]
 
     def get_table_info(self, dataset_name: str, table_name: str) -> Dict[str, Any]:
         """
@@ -164,9 +455,10 @@ class BigQueryClient:
             Dictionary containing table information
         """
         try:
-            dataset_ref = self.client.dataset(dataset_name)
-            table_ref = dataset_ref.table(table_name)
-            table = self.client.get_table(table_ref)
+            table = self._get_table(dataset_name, table_name)
+            if table is None:
+                logger.error(f"Table {dataset_name}.{table_name} not found")
+                return {}
 
             return {
                 "table_id": table.table_id,
@@ -195,92 +487,107 @@ class BigQueryClient:
             )
             return {}
 
-    def upsert_table_from_csv(
+    def submit_upsert_load(
         self,
         dataset_name: str,
         table_name: str,
-        gcs_uri: str,
+        gcs_uri: Union[str, List[str]],
         temp_table_suffix: str = "_temp",
         schema: Optional[List[bigquery.SchemaField]] = None,
         enforce_dataset_location: bool = True,
-    ) -> bool:
+    ) -> Optional[bigquery.LoadJob]:
         """
-        Upsert (update or insert) data from CSV into existing table
+        Submit the staging load of an upsert without waiting for it
+
+        Once the returned job has finished, submit_merge_from_temp merges the
+        staged rows into the target table.
 
         Args:
             dataset_name: Name of the dataset
             table_name: Name of the target table
-            gcs_uri: GCS URI of the CSV file
+            gcs_uri: GCS URI, wildcard URI, or list of URIs of the CSV files
             temp_table_suffix: Suffix for temporary table
             schema: Table schema (optional)
 
         Returns:
-            True if upsert was successful, False otherwise
+            The running LoadJob into the temp table, or None if it could not
+            be submitted
         """
-        try:
-            # Check if target table exists
-            table_exists = self.table_exists(dataset_name, table_name)
+        temp_table_name = f"{table_name}{temp_table_suffix}"
 
-            if not table_exists:
-                # If table doesn't exist, just create it
-                return self.create_table_from_csv(
-                    dataset_name, table_name, gcs_uri, schema, "WRITE_TRUNCATE"
+        # Ensure we operate in the dataset's location when creating temp tables
+        dataset_ref = self.client.dataset(dataset_name)
+        try:
+            dataset_obj = self.client.get_dataset(dataset_ref)
+            dataset_location = dataset_obj.location or self.location
+        except Exception:
+            # If we can't fetch the dataset, fall back to client-configured location
+            dataset_location = self.location
+
+        # If the dataset exists in a different region than the client-configured
+        # region, optionally enforce that they match. If enforcement is enabled
+        # we'll fail-fast with a helpful log so callers can fix their config.
+        if dataset_location != self.location:
+            msg = (
+                f"Dataset {dataset_name} is in location {dataset_location} "
+                f"but client is configured for {self.location}."
+            )
+            if enforce_dataset_location:
+                logger.error(f"Dataset location mismatch: {msg} Upsert aborted.")
+                return None
+            else:
+                logger.warning(
+                    f"Dataset location mismatch: {msg} Proceeding because enforce_dataset_location is False."
                 )
 
-            # If table exists, create a temporary table with new data
-            temp_table_name = f"{table_name}{temp_table_suffix}"
+        # Load new data into temp table (in dataset's location). A leftover
+        # temp table from an earlier run is simply overwritten by
+        # WRITE_TRUNCATE, which keeps its expiration; push that out first so
+        # it cannot lapse between this load and the MERGE
+        self._set_temp_table_expiry(dataset_name, temp_table_name)
+        return self.submit_load_from_csv(
+            dataset_name,
+            temp_table_name,
+            gcs_uri,
+            schema=schema,
+            write_disposition="WRITE_TRUNCATE",
+            location=dataset_location,
+        )
+
+    def submit_merge_from_temp(
+        self,
+        dataset_name: str,
+        table_name: str,
+        temp_table_suffix: str = "_temp",
+        location: Optional[str] = None,
+    ) -> Optional[bigquery.QueryJob]:
+        """
+        Submit the MERGE of a loaded temp table into its target table
 
-            # Ensure we operate in the dataset's location when creating temp tables
-            dataset_ref = self.client.dataset(dataset_name)
-            try:
-                dataset_obj = self.client.get_dataset(dataset_ref)
-                dataset_location = dataset_obj.location or self.location
-            except Exception:
-                # If we can't fetch the dataset, fall back to client-configured location
-                dataset_location = self.location
-
-            # If the dataset exists in a different region than the client-configured
-            # region, optionally enforce that they match. If enforcement is enabled
-            # we'll fail-fast with a helpful log so callers can fix their config.
-            if dataset_location != self.location:
-                msg = (
-                    f"Dataset {dataset_name} is in location {dataset_location} "
-                    f"but client is configured for {self.location}."
-                )
-                if enforce_dataset_location:
-                    logger.error(
-                        f"Dataset location mismatch: {msg} Upsert aborted."
-                    )
-                    return False
-                else:
-                    logger.warning(
-                        f"Dataset location mismatch: {msg} Proceeding because enforce_dataset_location is False."
-                    )
+        Args:
+            dataset_name: Name of the dataset
+            table_name: Name of the target table
+            temp_table_suffix: Suffix for temporary table
+            location: Job location; use the staging load job's location
 
-            # If a previous temp table exists, delete it before loading new data.
-            try:
-                existing_temp = self.client.get_table(dataset_ref.table(temp_table_name))
-                if existing_temp:
-                    self.client.delete_table(dataset_ref.table(temp_table_name))
-            except Exception:
-                # not existing is fine
-                pass
-
-            # Load new data into temp table (in dataset's location)
-            if not self.create_table_from_csv(
-                dataset_name, temp_table_name, gcs_uri, schema, "WRITE_TRUNCATE", location=dataset_location
-            ):
-                return False
+        Returns:
+            The running MERGE QueryJob, or None if it could not be submitted
+        """
+        temp_table_name = f"{table_name}{temp_table_suffix}"
+        try:
+            # Let BigQuery expire the temp table instead of deleting it
+            # ourselves; if that fails, wait_merge deletes it
+            if not self._set_temp_table_expiry(dataset_name, temp_table_name):
+                with self._table_cache_lock:
+                    self._unexpired_temp_tables.add((dataset_name, temp_table_name))
 
             # Get schema to determine primary key (assume first field as key for this example)
             # In a real implementation, you'd determine this more robustly
-            target_table = self.client.get_table(
-                self.client.dataset(dataset_name).table(table_name)
-            )
+            target_table = self._get_table(dataset_name, table_name)
 
-            if not target_table.schema:
+            if target_table is None or not target_table.schema:
                 logger.error(f"Target table {dataset_name}.{table_name} has no schema")
-                return False
+                return None
 
             # Find a suitable primary key (prefer id or first field)
             primary_key = None
@@ -292,51 +599,184 @@ class BigQueryClient:
             if not primary_key:
                 primary_key = target_table.schema[0].name
 
-            # NOTE: we already deleted any pre-existing temp table before loading
-            # new data, so don't remove the temp table here (we need it for the
-            # MERGE). The final cleanup occurs after the merge below.
+            # NOTE: the temp table is left in place after the MERGE; its
+            # expiration time (set above) takes care of the cleanup, or
+            # wait_merge deletes it when the expiration could not be set.
+
+            # Build the column lists once; wide tables would otherwise walk the
+            # schema three times inside the f-string
+            column_names = [field.name for field in target_table.schema]
+            set_clause = ", ".join(
+                f"target.{name} = source.{name}"
+                for name in column_names
+                if name != primary_key
+            )
+            insert_columns = ", ".join(column_names)
+            insert_values = ", ".join(f"source.{name}" for name in column_names)
 
+            # MERGE scans the whole target unless it is partitioned/clustered on
+            # the key, so callers with large tables should cluster by primary_key.
             # Construct SQL for upsert with better handling of duplicates
             sql = f"""
             MERGE `{self.project_id}.{dataset_name}.{table_name}` AS target
             USING `{self.project_id}.{dataset_name}.{temp_table_name}` AS source
             ON target.{primary_key} = source.{primary_key}
             WHEN MATCHED THEN
-              UPDATE SET {
-                ", ".join(
-                    [
-                        f"target.{field.name} = source.{field.name}"
-                        for field in target_table.schema
-                        if field.name != primary_key
-                    ]
-                )
-            }
+              UPDATE SET {set_clause}
             WHEN NOT MATCHED THEN
-              INSERT ({", ".join([field.name for field in target_table.schema])})
-              VALUES ({
-                ", ".join(["source." + field.name for field in target_table.schema])
-            })
+              INSERT ({insert_columns})
+              VALUES ({insert_values})
             """
 
             # Ensure the MERGE query runs in the dataset's location
-            query_job = self.client.query(sql, location=dataset_location)
-            query_job.result()
+            return self.client.query(sql, location=location or self.location)
+        except GoogleAPIError as e:
+            logger.error(f"Error during upsert for {dataset_name}.{table_name}: {e}")
+            return None
 
-            # Delete temporary table
-            self.client.delete_table(
-                self.client.dataset(dataset_name).table(temp_table_name)
+    def wait_merge(
+        self,
+        dataset_name: str,
+        table_name: str,
+        job: Optional[bigquery.QueryJob],
+        timeout: Optional[float] = None,
+        temp_table_suffix: str = "_temp",
+    ) -> bool:
+        """
+        Wait for a MERGE submitted by submit_merge_from_temp to finish
+
+        Args:
+            dataset_name: Name of the dataset
+            table_name: Name of the target table
+            job: The MERGE job (None counts as failed)
+            timeout: Optional wait timeout in seconds
+            temp_table_suffix: Suffix for temporary table
+
+        Returns:
+            True if the upsert completed, False otherwise
+        """
+        if job is None:
+            self._delete_unexpired_temp_table(
+                dataset_name, f"{table_name}{temp_table_suffix}"
             )
+            return False
 
-            logger.info(f"Upsert completed for {dataset_name}.{table_name}")
+        try:
+            job.result(timeout=timeout)
+            logger.debug(f"Upsert completed for {dataset_name}.{table_name}")
             return True
-        except GoogleAPIError as e:
+        except (GoogleAPIError, concurrent.futures.TimeoutError) as e:
             logger.error(f"Error during upsert for {dataset_name}.{table_name}: {e}")
             return False
+        finally:
+            self._invalidate_table(dataset_name, table_name)
+            self._delete_unexpired_temp_table(
+                dataset_name, f"{table_name}{temp_table_suffix}"
+            )
+
+    def _set_temp_table_expiry(self, dataset_name: str, temp_table_name: str) -> bool:
+        """
+        Set an upsert temp table to expire _TEMP_TABLE_TTL from now
+
+        Args:
+            dataset_name: Name of the dataset
+            temp_table_name: Name of the temp table
+
+        Returns:
+            True if the expiration was set or the table does not exist yet,
+            False otherwise
+        """
+        temp_table = bigquery.Table(
+            self.client.dataset(dataset_name).table(temp_table_name)
+        )
+        temp_table.expires = datetime.now(timezone.utc) + _TEMP_TABLE_TTL
+        try:
+            self.client.update_table(temp_table, ["expires"])
+            return True
+        except NotFound:
+            return True
+        except GoogleAPIError as e:
+            logger.warning(
+                f"Could not set expiration on {dataset_name}.{temp_table_name}: {e}"
+            )
+            return False
+
+    def _delete_unexpired_temp_table(
+        self, dataset_name: str, temp_table_name: str
+    ) -> None:
+        """Delete a temp table whose expiration could not be set"""
+        key = (dataset_name, temp_table_name)
+        with self._table_cache_lock:
+            if key not in self._unexpired_temp_tables:
+                return
+            self._unexpired_temp_tables.discard(key)
+        try:
+            self.client.delete_table(
+                self.client.dataset(dataset_name).table(temp_table_name),
+                not_found_ok=True,
+            )
+        except GoogleAPIError as e:
+            logger.warning(f"Could not delete {dataset_name}.{temp_table_name}: {e}")
+
+    def upsert_table_from_csv(
+        self,
+        dataset_name: str,
+        table_name: str,
+        gcs_uri: str,
+        temp_table_suffix: str = "_temp",
+        schema: Optional[List[bigquery.SchemaField]] = None,
+        enforce_dataset_location: bool = True,
+    ) -> bool:
+        """
+        Upsert (update or insert) data from CSV into existing table
+
+        Args:
+            dataset_name: Name of the dataset
+            table_name: Name of the target table
+            gcs_uri: GCS URI of the CSV file
+            temp_table_suffix: Suffix for temporary table
+            schema: Table schema (optional)
+
+        Returns:
+            True if upsert was successful, False otherwise
+        """
+        # If table doesn't exist, just create it
+        if not self.table_exists(dataset_name, table_name):
+            return self.create_table_from_csv(
+                dataset_name,
+                table_name,
+                gcs_uri,
+                schema=schema,
+                write_disposition="WRITE_TRUNCATE",
+            )
+
+        load_job = self.submit_upsert_load(
+            dataset_name,
+            table_name,
+            gcs_uri,
+            temp_table_suffix=temp_table_suffix,
+            schema=schema,
+            enforce_dataset_location=enforce_dataset_location,
+        )
+        if not self.wait_loads([load_job])[0]:
+            return False
+
+        merge_job = self.submit_merge_from_temp(
+            dataset_name,
+            table_name,
+            temp_table_suffix=temp_table_suffix,
+            location=load_job.location,
+        )
+        return self.wait_merge(dataset_name, table_name, merge_job)
 
     def get_row_count(self, dataset_name: str, table_name: str) -> int:
         """
         Get row count for a table
 
+        The count is read from table metadata, which costs no query bytes.
+        Tables with a streaming buffer fall back to COUNT(*) because buffered
+        rows are not reflected in the metadata yet.
+
         Args:
             dataset_name: Name of the dataset
             table_name: Name of the table
@@ -345,6 +785,13 @@ class BigQueryClient:
             Number of rows in the table
         """
         try:
+            table = self._get_table(dataset_name, table_name)
+            if table is None:
+                logger.error(f"Table {dataset_name}.{table_name} not found")
+                return 0
+            if table.streaming_buffer is None:
+                return int(table.num_rows or 0)
+
             query = f"SELECT COUNT(*) as count FROM `{self.project_id}.{dataset_name}.{table_name}`"
             query_job = self.client.query(query)
             results = query_job.result()
@@ -358,3 +805,122 @@ class BigQueryClient:
                 f"Error getting row count for {dataset_name}.{table_name}: {e}"
             )
             return 0
+
+    def get_row_counts(self, dataset_name: str) -> Optional[Dict[str, int]]:
+        """
+        Get the row count of every table in a dataset with one metadata query
+
+        Reads the dataset's __TABLES__ metadata, which costs no query bytes.
+        Like table metadata, it does not reflect rows still in a streaming
+        buffer; this project only writes through load jobs.
+
+        Args:
+            dataset_name: Name of the dataset
+
+        Returns:
+            Dictionary mapping table name to row count (empty if the dataset
+            is missing), or None on error so callers can fall back to
+            per-table lookups
+        """
+        query = (
+            f"SELECT table_id, row_count "
+            f"FROM `{self.project_id}.{dataset_name}.__TABLES__`"
+        )
+        try:
+            counts = {
+                row.table_id: int(row.row_count or 0)
+                for row in self.client.query(query).result()
+            }
+        except NotFound:
+            return {}
+        except GoogleAPIError as e:
+            logger.error(f"Error getting row counts for dataset {dataset_name}: {e}")
+            return None
+
+        with self._table_cache_lock:
+            self._known_tables.update((dataset_name, name) for name in counts)
+        return counts
+
+    def get_table_schemas(
+        self, dataset_name: str
+    ) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Get the column types of every table in a dataset with one query
+
+        Args:
+            dataset_name: Name of the dataset
+
+        Returns:
+            Dictionary mapping table name to {column name: type}, with types
+            named as in get_table_info (empty if the dataset is missing), or
+            None on error so callers can fall back to per-table lookups
+        """
+        query = (
+            f"SELECT table_name, column_name, data_type "
+            f"FROM `{self.project_id}.{dataset_name}.INFORMATION_SCHEMA.COLUMNS` "
+            f"ORDER BY table_name, ordinal_position"
+        )
+        try:
+            schemas: Dict[str, Dict[str, str]] = {}
+            for row in self.client.query(query).result():
+                schemas.setdefault(row.table_name, {})[row.column_name] = (
+                    _legacy_type_name(row.data_type)
+                )
+        except NotFound:
+            return {}
+        except GoogleAPIError as e:
+            logger.error(f"Error getting table schemas for dataset {dataset_name}: {e}")
+            return None
+
+        with self._table_cache_lock:
+            self._known_tables.update((dataset_name, name) for name in schemas)
+        return schemas
+
+    def read_table_arrow(
+        self,
+        dataset_name: str,
+        table_name: str,
+        selected_fields: Optional[List[str]] = None,
+    ) -> Optional["pyarrow.Table"]:
+        """
+        Read a whole table as Arrow
+
+        Uses the BigQuery Storage Read API (parallel Arrow streams) when
+        google-cloud-bigquery-storage is installed, and the tabledata REST
+        API otherwise.
+
+        Args:
+            dataset_name: Name of the dataset
+            table_name: Name of the table
+            selected_fields: Optional column names to read; all when omitted
+
+        Returns:
+            A pyarrow.Table with the table contents, or None on error
+        """
+        try:
+            table = self._get_table(dataset_name, table_name)
+            if table is None:
+                logger.error(f"Table {dataset_name}.{table_name} not found")
+                return None
+
+            fields = None
+            if selected_fields:
+                wanted = set(selected_fields)
+                fields = [field for field in table.schema if field.name in wanted]
+
+            rows = self.client.list_rows(table, selected_fields=fields)
+            return rows.to_arrow(bqstorage_client=self._get_bqstorage_client())
+        except GoogleAPIError as e:
+            logger.error(f"Error reading {dataset_name}.{table_name}: {e}")
+            return None
+
+    def _get_bqstorage_client(self) -> Optional["bigquery_storage.BigQueryReadClient"]:
+        """Lazily create a Storage Read API client sharing our credentials"""
+        if bigquery_storage is None:
+            return None
+        with self._bqstorage_lock:
+            if self._bqstorage_client is None:
+                self._bqstorage_client = bigquery_storage.BigQueryReadClient(
+                    credentials=self.client._credentials
+                )
+            return self._bqstorage_client
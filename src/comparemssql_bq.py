@@ -8,15 +8,6 @@ import os
 import sys
 from typing import List, Optional
 
-try:
-    from bigquery_client import BigQueryClient
-    from mssql_client import MSSQLClient
-    from validator_mssql import Validator
-except ImportError:
-    from src.bigquery_client import BigQueryClient
-    from src.mssql_client import MSSQLClient
-    from src.validator_mssql import Validator
-
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -25,11 +16,6 @@ try:
 except ImportError:
     pass  # dotenv not available, user must have environment variables set
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +30,10 @@ def main():
     parser.add_argument(
         "--bq-dataset", required=True, help="BigQuery dataset name to validate"
     )
+    parser.add_argument(
+        "--bq-location",
+        help="BigQuery dataset location/region (default: inferred by BigQuery)",
+    )
     parser.add_argument(
         "--mssql-connection-string",
         help="MSSQL connection string (overrides SQL_CONNECTION_STRING env var)",
@@ -72,10 +62,27 @@ def main():
 
     args = parser.parse_args()
 
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    # Imported after argument parsing so --help does not load the BigQuery
+    # and ODBC client libraries
+    try:
+        from bigquery_client import BigQueryClient
+        from mssql_client import MSSQLClient
+        from validator_mssql import Validator
+    except ImportError:
+        from src.bigquery_client import BigQueryClient
+        from src.mssql_client import MSSQLClient
+        from src.validator_mssql import Validator
+
     try:
         # Initialize BigQuery client
         logger.info("Initializing BigQuery client...")
-        bq_client = BigQueryClient(args.bq_project_id)
+        bq_client = BigQueryClient(args.bq_project_id, args.bq_location)
 
         # Initialize MSSQL client using connection string approach from testmssqlcon.py
         logger.info("Initializing MSSQL client...")
@@ -2,97 +2,97 @@
 Main execution module for CSV to BigQuery ETL process
 """
 
+from __future__ import annotations
+
 import argparse
 import concurrent.futures
+import functools
 import json
 import logging
 import os
 import sys
-from posix import O_RDONLY
-from typing import Any, Dict, List, Optional
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
+try:
+    import orjson
+except ImportError:  # optional: faster config and report (de)serialization
+    orjson = None
 
-def process_single_file(
-    bq_client: BigQueryClient, config: Dict[str, Any], csv_file: str, service: str
-) -> Dict[str, Any]:
-    """
-    Process a single CSV file
+# The Google client libraries take a while to import, so they are loaded on
+# first use; --help and argument errors never pay for them
+if TYPE_CHECKING:
+    from google.cloud import bigquery
 
-    Args:
-        bq_client: BigQuery client instance
-        config: Configuration dictionary
-        csv_file: CSV file path
-        service: Service name
+    from bigquery_client import BigQueryClient
+    from CSV_reader import CSVReader
+    from mssql_client import MSSQLClient
+    from validator import Validator
 
-    Returns:
-        Dictionary with processing result
-    """
-    try:
-        # Extract table name from file path
-        table_name = os.path.splitext(os.path.basename(csv_file))[0]
 
-        # Construct GCS URI for this file
-        gcs_uri = f"gs://{config.get('gcs_bucket')}/{csv_file}"
+logger = logging.getLogger(__name__)
 
-        # Get dataset name for this service using config template (with hyphens replaced)
-        service_name_for_dataset = service.replace("-", "_")
-        dataset_name = get_dataset_name(config, service_name_for_dataset).lower()
-        table_exists = bq_client.table_exists(dataset_name, table_name)
+# Settings every run needs; load_config rejects a file without them
+_REQUIRED_CONFIG_KEYS = ("project_id", "region", "gcs_bucket")
+
+# Services processed when the configuration does not list them
+_DEFAULT_SERVICES = (
+    "auth-service",
+    "career-service",
+    "data-protection-service",
+    "digital-credential-service",
+    "document-service",
+    "learning-service",
+    "notification-service",
+    "portfolio-service",
+    "question-bank-service",
+)
 
-        # Create or update table
-        if table_exists:
-            success = bq_client.upsert_table_from_csv(
-                dataset_name=dataset_name,
-                table_name=table_name,
-                gcs_uri=gcs_uri,
-            )
-            write_operation = "upsert"
-        else:
-            success = bq_client.create_table_from_csv(
-                dataset_name=dataset_name,
-                table_name=table_name,
-                gcs_uri=gcs_uri,
-                write_disposition="WRITE_TRUNCATE",
-            )
-            write_operation = "create"
+# Values used when the configuration file leaves a setting out
+_CONFIG_DEFAULTS = {
+    "dataset_name_template": "dev_{service}_service",
+    "gcs_base_path_template": "sql-exports/{date}/csvextract/{service}",
+}
 
-        return {
-            "file_path": csv_file,
-            "table_name": table_name,
-            "operation": write_operation,
-            "success": success,
-        }
-    except Exception as e:
-        logger.error(f"Error processing file {csv_file}: {e}")
-        return {
-            "file_path": csv_file,
-            "table_name": os.path.splitext(os.path.basename(csv_file))[0],
-            "operation": "unknown",
-            "success": False,
-            "error": str(e),
-        }
 
+def _json_default(obj: Any) -> Any:
+    """Convert values JSON has no type for; numbers stay numbers"""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    # numpy/pandas scalars (e.g. counts taken from a DataFrame)
+    if hasattr(obj, "item") and callable(obj.item):
+        try:
+            return obj.item()
+        except (TypeError, ValueError):
+            pass
+    return str(obj)
 
-try:
-    from bigquery_client import BigQueryClient
-    from CSV_reader import CSVReader
-    from validator import Validator
-except ImportError:
-    from src.bigquery_client import BigQueryClient
-    from src.CSV_reader import CSVReader
-    from src.validator import Validator
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("csv2bigquery.log"),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
 
-logger = logging.getLogger(__name__)
+def _json_dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize to JSON with orjson when installed, else the stdlib"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option).decode()
+    return json.dumps(obj, default=_json_default, indent=2 if pretty else None)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config_bytes(config_path: str, mtime_ns: int) -> bytes:
+    """Read a config file; the mtime in the key makes edits re-read it"""
+    with open(config_path, "rb") as f:
+        return f.read()
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
@@ -103,16 +103,26 @@ def load_config(config_path: str) -> Dict[str, Any]:
         config_path: Path to configuration file
 
     Returns:
-        Dictionary with configuration parameters
+        Dictionary with configuration parameters (defaults filled in), or an
+        empty dictionary if the file cannot be read or lacks required keys
     """
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-        return config
+        data = _read_config_bytes(config_path, os.stat(config_path).st_mtime_ns)
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
     except Exception as e:
         logger.error(f"Error loading configuration from {config_path}: {e}")
         return {}
 
+    # Fail at startup rather than building URIs like gs://None/... per file
+    missing = [key for key in _REQUIRED_CONFIG_KEYS if not config.get(key)]
+    if missing:
+        logger.error(
+            f"Configuration {config_path} is missing required keys: {', '.join(missing)}"
+        )
+        return {}
+
+    return {**_CONFIG_DEFAULTS, **config}
+
 
 def initialize_clients(
     config: Dict[str, Any],
@@ -126,6 +136,13 @@ def initialize_clients(
     Returns:
         Tuple of (BigQueryClient, CSVReader)
     """
+    try:
+        from bigquery_client import BigQueryClient
+        from CSV_reader import CSVReader
+    except ImportError:
+        from src.bigquery_client import BigQueryClient
+        from src.CSV_reader import CSVReader
+
     # Initialize BigQuery client
     bq_client = BigQueryClient(
         project_id=config.get("project_id"),
@@ -230,6 +247,20 @@ def create_datasets(bq_client: BigQueryClient, datasets: List[str]) -> None:
         bq_client.create_dataset(dataset, exists_ok=True)
 
 
+@functools.lru_cache(maxsize=None)
+def _render_dataset(template: str, service: str) -> str:
+    """Render a dataset name template (memoized; called once per file)"""
+    return template.format(service=service)
+
+
+@functools.lru_cache(maxsize=None)
+def _render_gcs(template: str, service: str, date: str) -> str:
+    """Render a GCS path template (memoized; called once per file)"""
+    # Transform service name to include dev- prefix to match actual GCS structure
+    # The actual directories have the format: sql-exports/YYYYMMDD/csvextract/dev-service-name
+    return template.format(date=date, service=f"dev-{service}")
+
+
 def get_dataset_name(config: Dict[str, Any], service: str) -> str:
     """
     Generate dataset name for a specific service using template
@@ -242,7 +273,21 @@ def get_dataset_name(config: Dict[str, Any], service: str) -> str:
         Dataset name string
     """
     template = config.get("dataset_name_template", "dev_{service}_service")
-    return template.format(service=service)
+    return _render_dataset(template, service)
+
+
+def get_service_dataset_name(config: Dict[str, Any], service: str) -> str:
+    """
+    Dataset name for a service, following BigQuery naming rules
+
+    Args:
+        config: Configuration dictionary
+        service: Service name (may contain hyphens)
+
+    Returns:
+        Lowercase dataset name with hyphens replaced by underscores
+    """
+    return get_dataset_name(config, service.replace("-", "_")).lower()
 
 
 def get_gcs_path(config: Dict[str, Any], service: str, date: str) -> str:
@@ -257,14 +302,167 @@ def get_gcs_path(config: Dict[str, Any], service: str, date: str) -> str:
     Returns:
         GCS path string
     """
-    # Transform service name to include dev- prefix to match actual GCS structure
-    # The actual directories have the format: sql-exports/YYYYMMDD/csvextract/dev-service-name
-    transformed_service = f"dev-{service}"
+    template = config.get(
+        "gcs_base_path_template", "sql-exports/{date}/csvextract/{service}"
+    )
+    return _render_gcs(template, service, date)
+
+
+def list_csv_files_by_service(
+    csv_reader: CSVReader,
+    config: Dict[str, Any],
+    services: List[str],
+    date_folder: str,
+) -> Dict[str, List[str]]:
+    """
+    List the CSV files of every service with a single GCS listing
+
+    Args:
+        csv_reader: CSV reader instance
+        config: Configuration dictionary
+        services: Services to group the files by
+        date_folder: Date folder for the export
 
+    Returns:
+        Dictionary mapping each service to its CSV file paths
+    """
+    # Everything before "{service}" in the template is shared by all services
     template = config.get(
         "gcs_base_path_template", "sql-exports/{date}/csvextract/{service}"
     )
-    return template.format(date=date, service=transformed_service)
+    common_prefix, _, remainder = template.partition("{service}")
+    common_prefix = common_prefix.format(date=date_folder)
+
+    if not remainder or remainder.startswith("/"):
+        # The service is a whole path segment, so the reader can bucket files
+        # by that segment in one pass; only a subfolder after it needs checking.
+        # Folder names come from the rendered paths, which may decorate the
+        # service name (e.g. "dev-{service}")
+        base = common_prefix.lstrip("/")
+        service_folders = {}
+        for service in services:
+            path = get_gcs_path(config, service, date_folder).lstrip("/")
+            folder = path[len(base) :].lstrip("/").split("/", 1)[0]
+            service_folders[folder] = service
+        files_by_service = csv_reader.list_csv_files_by_service(
+            common_prefix, service_folders
+        )
+        if remainder.strip("/"):
+            for service, csv_files in files_by_service.items():
+                path = get_gcs_path(config, service, date_folder).lstrip("/")
+                files_by_service[service] = [f for f in csv_files if f.startswith(path)]
+        return files_by_service
+
+    all_files = csv_reader.list_csv_files_in_gcs(common_prefix)
+
+    files_by_service = {}
+    for service in services:
+        service_gcs_path = get_gcs_path(config, service, date_folder).lstrip("/")
+        files_by_service[service] = [
+            f for f in all_files if f.startswith(service_gcs_path)
+        ]
+    return files_by_service
+
+
+def _file_versions_by_table(
+    csv_files: List[str], generations: Dict[str, Optional[str]]
+) -> Dict[str, Dict[str, Optional[str]]]:
+    """Map each table to the GCS generation of each of its CSV files"""
+    return {
+        table_name: {f: generations.get(f) for f in table_files}
+        for table_name, table_files in group_csv_files_by_table(csv_files).items()
+    }
+
+
+def group_csv_files_by_table(csv_files: List[str]) -> Dict[str, List[str]]:
+    """
+    Group CSV file paths by the table their file name maps to
+
+    Args:
+        csv_files: CSV file paths
+
+    Returns:
+        Dictionary mapping each table name to its files, in listing order
+    """
+    files_by_table: Dict[str, List[str]] = {}
+    for csv_file in csv_files:
+        table_name = os.path.splitext(os.path.basename(csv_file))[0]
+        files_by_table.setdefault(table_name, []).append(csv_file)
+    return files_by_table
+
+
+def submit_file_load(
+    bq_client: BigQueryClient,
+    config: Dict[str, Any],
+    csv_file: Union[str, List[str]],
+    dataset_name: str,
+    csv_reader: Optional[CSVReader] = None,
+    existing_tables: Optional[Set[str]] = None,
+    table_name: Optional[str] = None,
+) -> Tuple[str, Optional[bigquery.LoadJob]]:
+    """
+    Submit the load job for a CSV file without waiting for it
+
+    Existing tables get a staging load whose MERGE must be submitted once the
+    load has finished; new tables are loaded directly.
+
+    Args:
+        bq_client: BigQuery client instance
+        config: Configuration dictionary
+        csv_file: CSV file path, or several paths that load into the same
+            table as a single job
+        dataset_name: Dataset the table belongs to
+        csv_reader: CSV reader used to infer the load schema when
+            "preflight_schema" is enabled in the configuration
+        existing_tables: Names of the tables already in the dataset; the
+            table is looked up individually when omitted
+        table_name: Target table if already derived from the file name
+
+    Returns:
+        Tuple of ("upsert" or "create", the submitted LoadJob or None)
+    """
+    csv_files = [csv_file] if isinstance(csv_file, str) else csv_file
+
+    # Extract table name from file path
+    if table_name is None:
+        table_name = os.path.splitext(os.path.basename(csv_files[0]))[0]
+
+    # Construct GCS URIs for the files; load_table_from_uri takes the list
+    uri_prefix = f"gs://{config.get('gcs_bucket')}/"
+    gcs_uris = [uri_prefix + path for path in csv_files]
+    gcs_uri = gcs_uris[0] if len(gcs_uris) == 1 else gcs_uris
+
+    if existing_tables is not None:
+        table_exists = table_name in existing_tables
+    else:
+        table_exists = bq_client.table_exists(dataset_name, table_name)
+
+    # Optionally pass an explicit schema so the load skips autodetect. An
+    # upsert stages rows for a MERGE into the existing table, so it loads with
+    # that table's schema; a schema inferred from the CSV could disagree with
+    # it (e.g. TIMESTAMP vs DATE) and fail the MERGE. New tables are inferred
+    # from the first file of the group only
+    schema = None
+    if config.get("preflight_schema") and csv_reader:
+        if table_exists:
+            schema = bq_client.get_table_fields(dataset_name, table_name)
+        else:
+            schema = bq_client.infer_bq_schema(csv_reader, csv_files[0])
+
+    if table_exists:
+        job = bq_client.submit_upsert_load(
+            dataset_name, table_name, gcs_uri, schema=schema
+        )
+        return "upsert", job
+
+    job = bq_client.submit_load_from_csv(
+        dataset_name,
+        table_name,
+        gcs_uri,
+        schema=schema,
+        write_disposition="WRITE_TRUNCATE",
+    )
+    return "create", job
 
 
 def process_service(
@@ -274,6 +472,11 @@ def process_service(
     service: str,
     date_folder: str = "20251201",
     specific_table: Optional[str] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    csv_files: Optional[List[str]] = None,
+    report_file_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    dataset_name: Optional[str] = None,
+    skip_tables: Optional[Set[str]] = None,
 ) -> Dict[str, Any]:
     """
     Process a specific service
@@ -285,6 +488,13 @@ def process_service(
         service: Service name
 
         date_folder: Date folder for the export
+        executor: Pool shared across services that runs the per-file load
+            submissions; a private one is created when omitted
+        csv_files: The service's CSV files if already listed by the caller
+        report_file_result: Called with each file result as soon as it is
+            known; when given, results are not also kept in "files_results"
+        dataset_name: The service's dataset if already resolved by the caller
+        skip_tables: Tables already loaded by an earlier run of this export
 
     Returns:
         Dictionary with processing results
@@ -296,7 +506,8 @@ def process_service(
     print("service_gcs_path: *********************", service_gcs_path)
 
     # List CSV files for this service
-    csv_files = csv_reader.list_csv_files_in_gcs(service_gcs_path)
+    if csv_files is None:
+        csv_files = csv_reader.list_csv_files_in_gcs(service_gcs_path)
     if not csv_files:
         logger.warning(f"No CSV files found for service: {service}")
         return {
@@ -317,13 +528,26 @@ def process_service(
         "files_results": [],
     }
 
+    # Files that map to the same table (same name in different folders) load
+    # together as one job; separate WRITE_TRUNCATE jobs would race and only
+    # the last file would survive. The table name is derived once per file.
+    files_by_table = group_csv_files_by_table(csv_files)
+
+    # Tables an earlier run already loaded are left alone on a rerun
+    if skip_tables:
+        skipped = [name for name in files_by_table if name in skip_tables]
+        for table_name in skipped:
+            del files_by_table[table_name]
+        if skipped:
+            logger.info(
+                f"Skipping {len(skipped)} already loaded tables in service: {service}"
+            )
+        csv_files = [f for files in files_by_table.values() for f in files]
+
     # Filter for specific table if provided
     if specific_table:
-        csv_files = [
-            f
-            for f in csv_files
-            if os.path.splitext(os.path.basename(f))[0] == specific_table
-        ]
+        csv_files = files_by_table.get(specific_table, [])
+        files_by_table = {specific_table: csv_files}
         if not csv_files:
             logger.warning(
                 f"No CSV file found for table: {specific_table} in service: {service}"
@@ -335,129 +559,132 @@ def process_service(
                 "files_processed": 0,
             }
 
-    # Process each CSV file in parallel for improved performance
-    # Determine number of workers based on file count (limit to 10 to avoid API rate limits)
-    max_file_workers = min(len(csv_files), 10)
+    # Submit every load job up front so BigQuery runs them concurrently, then
+    # wait on them from this thread instead of parking a worker per job
+    if dataset_name is None:
+        dataset_name = get_service_dataset_name(config, service)
 
-    if max_file_workers > 1:
-        logger.info(
-            f"Processing {len(csv_files)} files in parallel with {max_file_workers} workers"
+    def record(file_result: Dict[str, Any]) -> None:
+        if report_file_result:
+            report_file_result(file_result)
+        else:
+            results["files_results"].append(file_result)
+        if file_result["success"]:
+            results["files_processed"] += 1
+        else:
+            results["status"] = "warning"
+            results["message"] = "Some files failed to process"
+
+    # One tables.list call answers the exists check for every file
+    existing_tables = bq_client.list_table_names(dataset_name)
+
+    def record_files(
+        table_files: List[str],
+        table_name: str,
+        write_operation: str,
+        success: bool,
+        error: Optional[str] = None,
+        job_id: Optional[str] = None,
+    ) -> None:
+        for csv_file in table_files:
+            file_result = {
+                "file_path": csv_file,
+                "table_name": table_name,
+                "operation": write_operation,
+                "success": success,
+            }
+            if job_id is not None:
+                file_result["job_id"] = job_id
+            if error is not None:
+                file_result["error"] = error
+            record(file_result)
+
+    from google.api_core.exceptions import GoogleAPIError
+
+    # Each submission costs a few metadata round-trips, so run them on the
+    # shared pool; its size bounds concurrent requests across all services
+    own_executor = executor is None
+    if own_executor:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=config.get("max_concurrent_loads", 16)
         )
-
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_file_workers
-        ) as executor:
-            futures = []
-            for csv_file in csv_files:
-                # Skip prisma files
-                if "prisma" in csv_file.lower():
-                    logger.info(f"Skipping prisma file: {csv_file}")
-                    continue
-
-                future = executor.submit(
-                    process_single_file, bq_client, config, csv_file, service
+    try:
+        # Per-file lines are debug-only; a large service would otherwise
+        # serialize its workers on the logging handlers
+        log_files = logger.isEnabledFor(logging.DEBUG)
+        futures = []
+        for table_name, table_files in files_by_table.items():
+            if log_files:
+                logger.debug(
+                    f"Processing files: {table_files} -> table: {table_name}"
                 )
-                futures.append(future)
-
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    file_result = future.result()
-                    results["files_results"].append(file_result)
-
-                    if file_result["success"]:
-                        results["files_processed"] += 1
-                    else:
-                        results["status"] = "warning"
-                        results["message"] = "Some files failed to process"
-                except Exception as e:
-                    logger.error(f"Error in parallel file processing: {e}")
-                    results["files_results"].append(
-                        {
-                            "file_path": csv_file,
-                            "table_name": os.path.splitext(os.path.basename(csv_file))[
-                                0
-                            ],
-                            "operation": "unknown",
-                            "success": False,
-                            "error": str(e),
-                        }
-                    )
-                    results["status"] = "warning"
-                    results["message"] = "Some files failed to process"
-    else:
-        # Fall back to sequential processing for single file
-        for csv_file in csv_files:
-            try:
-                # Fall back to sequential processing for single file
-                for csv_file in csv_files:
-                    try:
-                        # Extract table name from file path
-                        table_name = os.path.splitext(os.path.basename(csv_file))[0]
-
-                        # Construct GCS URI for this file
-                        gcs_uri = f"gs://{config.get('gcs_bucket')}/{csv_file}"
-
-                        logger.info(
-                            f"Processing file: {csv_file} -> table: {table_name}"
-                        )
-
-                        # Get dataset name for this service using config template
-                        dataset_name = get_dataset_name(config, service)
-                        table_exists = bq_client.table_exists(dataset_name, table_name)
-
-                        # Create or update table
-                        if table_exists:
-                            success = bq_client.upsert_table_from_csv(
-                                dataset_name=dataset_name,
-                                table_name=table_name,
-                                gcs_uri=gcs_uri,
-                            )
-                            write_operation = "upsert"
-                        else:
-                            success = bq_client.create_table_from_csv(
-                                dataset_name=dataset_name,
-                                table_name=table_name,
-                                gcs_uri=gcs_uri,
-                                write_disposition="WRITE_TRUNCATE",
-                            )
-                            write_operation = "create"
-
-                        file_result = {
-                            "file_path": csv_file,
-                            "table_name": table_name,
-                            "operation": write_operation,
-                            "success": success,
-                        }
+            futures.append(
+                executor.submit(
+                    submit_file_load,
+                    bq_client,
+                    config,
+                    table_files,
+                    dataset_name,
+                    csv_reader,
+                    existing_tables,
+                    table_name,
+                )
+            )
+        concurrent.futures.wait(futures)
+    finally:
+        if own_executor:
+            executor.shutdown()
 
-                        results["files_results"].append(file_result)
+    submitted = []
+    for (table_name, table_files), future in zip(files_by_table.items(), futures):
+        try:
+            # Existing tables are loaded into a temp table and merged below
+            write_operation, job = future.result()
+            submitted.append((table_files, table_name, write_operation, job))
+        except GoogleAPIError as e:
+            # API errors fail this table only; anything else is a bug and
+            # propagates instead of being reported as a failed file
+            logger.error(f"Error processing files {table_files}: {e}")
+            record_files(table_files, table_name, "unknown", False, str(e))
+
+    logger.info(f"Waiting on {len(submitted)} load jobs for service: {service}")
+    loaded = bq_client.wait_loads([job for _, _, _, job in submitted])
+
+    # Staged upserts get their MERGE once the load has landed; submit them all
+    # before waiting so they also run side by side
+    merges = []
+    for (table_files, table_name, write_operation, job), success in zip(
+        submitted, loaded
+    ):
+        if success and write_operation == "upsert":
+            merge_job = bq_client.submit_merge_from_temp(
+                dataset_name, table_name, location=job.location
+            )
+            merges.append((table_files, table_name, merge_job))
+            continue
+
+        record_files(
+            table_files,
+            table_name,
+            write_operation,
+            success,
+            job_id=job.job_id if job is not None else None,
+        )
 
-                        if success:
-                            results["files_processed"] += 1
-                        else:
-                            results["status"] = "warning"
-                            results["message"] = "Some files failed to process"
-
-                    except Exception as e:
-                        logger.error(f"Error processing file {csv_file}: {e}")
-                        results["files_results"].append(
-                            {
-                                "file_path": csv_file,
-                                "table_name": os.path.splitext(
-                                    os.path.basename(csv_file)
-                                )[0],
-                                "operation": "unknown",
-                                "success": False,
-                                "error": str(e),
-                            }
-                        )
-                        results["status"] = "warning"
-                        results["message"] = "Some files failed to process"
-            except Exception as ex:
-                logger.error(f"Error processing files: {ex}")
-                results["status"] = "error"
-                results["message"] = "Failed to process files"
+    for table_files, table_name, merge_job in merges:
+        success = bq_client.wait_merge(dataset_name, table_name, merge_job)
+        record_files(
+            table_files,
+            table_name,
+            "upsert",
+            success,
+            job_id=merge_job.job_id if merge_job is not None else None,
+        )
 
+    logger.info(
+        f"Finished service: {service}, "
+        f"{results['files_processed']}/{len(csv_files)} files loaded"
+    )
     return results
 
 
@@ -467,6 +694,8 @@ def validate_single_service_table(
     service: str,
     table_name: str,
     date_folder: str = "20251201",
+    csv_files: Optional[List[str]] = None,
+    dataset_name: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Validate a specific table in a specific service
@@ -477,23 +706,22 @@ def validate_single_service_table(
         service: Service name
         table_name: Table name to validate
         date_folder: Date folder for the export
+        csv_files: The service's CSV files if already listed by the caller
+        dataset_name: The service's dataset if already resolved by the caller
 
     Returns:
         Dictionary with validation results
     """
     logger.info(f"Starting validation for service: {service}, table: {table_name}")
 
-    dataset_name = get_dataset_name(config, service)
+    if dataset_name is None:
+        dataset_name = get_service_dataset_name(config, service)
     service_gcs_path = get_gcs_path(config, service, date_folder)
 
     # Find the CSV file for this specific table
-    csv_files = validator.csv_reader.list_csv_files_in_gcs(service_gcs_path)
-    target_csv = None
-    for csv_file in csv_files:
-        csv_table_name = os.path.splitext(os.path.basename(csv_file))[0]
-        if csv_table_name == table_name:
-            target_csv = csv_file
-            break
+    if csv_files is None:
+        csv_files = validator.csv_reader.list_csv_files_in_gcs(service_gcs_path)
+    target_csv = group_csv_files_by_table(csv_files).get(table_name, [None])[0]
 
     if not target_csv:
         return {
@@ -510,15 +738,23 @@ def validate_single_service_table(
         "table": table_name,
     }
 
-    # Run completeness validation
-    completeness = validator.validate_single_file_completeness(
-        dataset_name, target_csv, table_name
-    )
-
-    # Run correctness validation
-    correctness = validator.validate_single_file_correctness(
-        dataset_name, target_csv, table_name
-    )
+    # Run completeness and correctness validation side by side; the two
+    # checks are independent BigQuery/GCS round-trips
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        completeness_future = executor.submit(
+            validator.validate_single_file_completeness,
+            dataset_name,
+            target_csv,
+            table_name,
+        )
+        correctness_future = executor.submit(
+            validator.validate_single_file_correctness,
+            dataset_name,
+            target_csv,
+            table_name,
+        )
+        completeness = completeness_future.result()
+        correctness = correctness_future.result()
 
     validation_results["completeness"] = completeness
     validation_results["correctness"] = correctness
@@ -533,11 +769,67 @@ def validate_single_service_table(
     return validation_results
 
 
+def _validate_one_service(
+    validator: Validator,
+    config: Dict[str, Any],
+    service: str,
+    date_folder: str,
+    csv_files: Optional[List[str]] = None,
+    dataset_name: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Run completeness and correctness validation for one service
+
+    Args:
+        validator: Validator instance
+        config: Configuration dictionary
+        service: Service name
+        date_folder: Date folder for the export
+        csv_files: The service's CSV files if already listed
+        dataset_name: The service's dataset if already resolved
+
+    Returns:
+        Tuple of (service, validation results for the service)
+    """
+    if dataset_name is None:
+        dataset_name = get_service_dataset_name(config, service)
+    service_gcs_path = get_gcs_path(config, service, date_folder)
+
+    # Run completeness and correctness validation side by side; the two
+    # checks are independent BigQuery/GCS round-trips
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        completeness_future = executor.submit(
+            validator.validate_completeness_gcs,
+            dataset_name,
+            service_gcs_path,
+            csv_files,
+        )
+        correctness_future = executor.submit(
+            validator.validate_correctness_gcs,
+            dataset_name,
+            service_gcs_path,
+            csv_files,
+        )
+        completeness = completeness_future.result()
+        correctness = correctness_future.result()
+
+    return service, {
+        "completeness": completeness,
+        "correctness": correctness,
+        "status": "success"
+        if completeness.get("status") == "success"
+        and correctness.get("status") == "success"
+        else "warning",
+    }
+
+
 def validate_results(
     validator: Validator,
     config: Dict[str, Any],
     services: List[str],
     date_folder: str = "20251201",
+    csv_files_by_service: Optional[Dict[str, List[str]]] = None,
+    dataset_by_service: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Validate results for all services
@@ -548,6 +840,8 @@ def validate_results(
         services: List of services to validate
 
         date_folder: Date folder for the export
+        csv_files_by_service: Each service's CSV files if already listed
+        dataset_by_service: Each service's dataset if already resolved
 
     Returns:
         Dictionary with validation results
@@ -560,36 +854,31 @@ def validate_results(
         "services": {},
     }
 
-    all_services_valid = True
-
-    for service in services:
-        # Convert hyphens to underscores for BigQuery dataset naming
-        service_name_for_dataset = service.replace("-", "_")
-        dataset_name = get_dataset_name(config, service_name_for_dataset).lower()
-        service_gcs_path = get_gcs_path(config, service, date_folder)
-
-        # Run completeness validation
-        completeness = validator.validate_completeness_gcs(
-            dataset_name, service_gcs_path
-        )
-
-        # Run correctness validation
-        correctness = validator.validate_correctness_gcs(dataset_name, service_gcs_path)
-
-        validation_results["services"][service] = {
-            "completeness": completeness,
-            "correctness": correctness,
-            "status": "success"
-            if completeness.get("status") == "success"
-            and correctness.get("status") == "success"
-            else "warning",
-        }
-
-        if (
-            completeness.get("status") != "success"
-            or correctness.get("status") != "success"
-        ):
-            all_services_valid = False
+    # Each service's validation is a handful of independent BigQuery queries,
+    # so run services side by side (capped like the service pool in main)
+    max_workers = max(1, min(len(services), 8))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _validate_one_service,
+                validator,
+                config,
+                service,
+                date_folder,
+                (csv_files_by_service or {}).get(service),
+                (dataset_by_service or {}).get(service),
+            )
+            for service in services
+        ]
+        # Collect in submission order so the report lists services as configured
+        for future in futures:
+            service, service_result = future.result()
+            validation_results["services"][service] = service_result
+
+    all_services_valid = all(
+        result["status"] == "success"
+        for result in validation_results["services"].values()
+    )
 
     if not all_services_valid:
         validation_results["status"] = "warning"
@@ -635,9 +924,24 @@ def main():
         action="store_true",
         help="Rerun processing for a specific service or table (requires --service, optionally --table)",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the run cache: list GCS afresh and reload every table",
+    )
 
     args = parser.parse_args()
 
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler("csv2bigquery.log"),
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
+
     # Load configuration
     config = load_config(args.config)
     if not config:
@@ -647,6 +951,11 @@ def main():
     # Initialize clients (optionally includes MSSQL client)
     bq_client, csv_reader, mssql_client = initialize_clients(config)
 
+    # Files/tables each validation checks side by side; services are
+    # validated in parallel on top of this
+    validation_workers = config.get("max_validation_workers", 4)
+    quoted_newlines = config.get("csv_quoted_newlines", True)
+
     # Choose Validator implementation depending on source
     # If MSSQL validation is requested, ensure MSSQL client is available
     if args.validate_source == "mssql":
@@ -662,28 +971,31 @@ def main():
             except ImportError:
                 from src.validator_mssql import Validator as MSSQLValidator
 
-            validator = MSSQLValidator(bq_client, csv_reader, mssql_client=mssql_client)
+            validator = MSSQLValidator(
+                bq_client,
+                csv_reader,
+                mssql_client=mssql_client,
+                max_workers=validation_workers,
+                allow_quoted_newlines=quoted_newlines,
+            )
         except Exception as e:
             logger.error(f"Failed to initialize MSSQL Validator: {e}")
             return 1
     else:
-        validator = Validator(bq_client, csv_reader)
+        try:
+            from validator import Validator
+        except ImportError:
+            from src.validator import Validator
+
+        validator = Validator(
+            bq_client,
+            csv_reader,
+            max_workers=validation_workers,
+            allow_quoted_newlines=quoted_newlines,
+        )
 
     # Get services list from configuration
-    services = config.get(
-        "services",
-        [
-            "auth-service",
-            "career-service",
-            "data-protection-service",
-            "digital-credential-service",
-            "document-service",
-            "learning-service",
-            "notification-service",
-            "portfolio-service",
-            "question-bank-service",
-        ],
-    )
+    services = list(config.get("services", _DEFAULT_SERVICES))
 
     # Override with specific service if provided
     if args.service:
@@ -702,137 +1014,279 @@ def main():
         return 1
 
     # Create datasets for all services using config template, change dataset name to lowercase and replace hyphens with underscores by the rule of bigquery naming convention
-    datasets = []
-    for service in services:
-        # Replace hyphens with underscores for BigQuery dataset naming
-        service_name_for_dataset = service.replace("-", "_")
-        dataset_name = get_dataset_name(config, service_name_for_dataset).lower()
-        logger.info(f"Creating dataset for service {service}: {dataset_name}")
-        datasets.append(dataset_name)
-
-    create_datasets(bq_client, datasets)
-
-    # Process services in parallel for improved performance
-    processing_results = {}
+    # Resolved once here and handed to every worker
+    dataset_by_service = {
+        service: get_service_dataset_name(config, service) for service in services
+    }
+    datasets = list(dataset_by_service.values())
+
+    # A single-table rerun targets a dataset that already exists and needs
+    # only its own service's listing, not the whole export
+    single_table = bool(args.rerun and args.table)
+    if not single_table:
+        for service, dataset_name in dataset_by_service.items():
+            logger.info(f"Creating dataset for service {service}: {dataset_name}")
+        create_datasets(bq_client, datasets)
+
+    # Listings and load outcomes persist between runs, so a rerun after a
+    # partial failure only loads the tables that are still missing
+    run_cache = None
+    run_cache_path = config.get("run_cache_path", "csv2bq_cache.sqlite")
+    if run_cache_path:
+        try:
+            from run_cache import RunCache
+        except ImportError:
+            from src.run_cache import RunCache
 
-    if not args.validate_only:
-        logger.info("Starting data processing")
+        run_cache = RunCache(
+            run_cache_path, listing_ttl=config.get("run_cache_listing_ttl", 3600)
+        )
+    report_stream = None
+    try:
+        # --full ignores what earlier runs recorded (results are still saved)
+        resume = bool(args.rerun and not single_table and run_cache and not args.full)
+
+        # List every service's CSV files once for both processing and validation
+        csv_files_by_service = None
+        cached_listing = None
+        file_generations: Dict[str, Optional[str]] = {}
+        if resume:
+            cached_listing = run_cache.get_listing(args.date, args.service)
+        if single_table:
+            service_gcs_path = get_gcs_path(config, args.service, args.date)
+            csv_files_by_service = {
+                args.service: csv_reader.list_csv_files_in_gcs(service_gcs_path)
+            }
+            file_generations = csv_reader.get_generations(
+                csv_files_by_service[args.service]
+            )
+        elif cached_listing is not None:
+            logger.info(f"Using cached CSV listing for service: {args.service}")
+            csv_files_by_service = {args.service: list(cached_listing)}
+            file_generations = cached_listing
+        elif not args.validate_only or args.validate_source == "gcs":
+            csv_files_by_service = list_csv_files_by_service(
+                csv_reader, config, services, args.date
+            )
+            file_generations = csv_reader.get_generations(
+                [f for files in csv_files_by_service.values() for f in files]
+            )
+            if run_cache:
+                # An empty listing is more likely a path problem than an empty
+                # export; don't let --rerun reuse it
+                for service, csv_files in csv_files_by_service.items():
+                    if csv_files:
+                        run_cache.store_listing(
+                            args.date,
+                            service,
+                            {f: file_generations.get(f) for f in csv_files},
+                        )
 
-        # Determine number of workers based on services count (limit to 5 to avoid API rate limits)
-        max_workers = min(len(services), 5)
+        # Versions of the files behind each table, so a table is only skipped
+        # on a rerun if its files are unchanged since it was loaded
+        versions_by_service = {
+            service: _file_versions_by_table(csv_files, file_generations)
+            for service, csv_files in (csv_files_by_service or {}).items()
+        }
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-            for service in services:
-                specific_table = args.table if args.rerun else None
-                future = executor.submit(
-                    process_service,
-                    bq_client,
-                    csv_reader,
-                    config,
-                    service,
+        # Stream file results to NDJSON as they finish instead of holding them all
+        # until the end of the run
+        report_stream_file = f"csv2bq_report_{args.date}.ndjson"
+        report_stream = open(report_stream_file, "w")
+        report_lock = threading.Lock()
+
+        def write_report_line(
+            kind: str, service: Optional[str], payload: Dict[str, Any]
+        ) -> None:
+            line = _json_dumps({"type": kind, "service": service, **payload})
+            with report_lock:
+                report_stream.write(line + "\n")
+
+        def report_file_result(service: str, file_result: Dict[str, Any]) -> None:
+            write_report_line("file", service, file_result)
+            if run_cache:
+                run_cache.mark_loaded(
                     args.date,
-                    specific_table,
+                    service,
+                    file_result["table_name"],
+                    file_result["success"],
+                    file_result.get("job_id"),
+                    versions_by_service.get(service, {}).get(
+                        file_result["table_name"]
+                    ),
                 )
-                futures.append(future)
 
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                processing_results[result["service"]] = result
-
-    # Validate results
-    if args.rerun and args.table:
-        # Validate only the specific table
-        if args.validate_source == "gcs":
-            validation_results = validate_single_service_table(
-                validator, config, args.service, args.table, args.date
+        # Process services in parallel for improved performance
+        processing_results = {}
+
+        if not args.validate_only and single_table:
+            logger.info(f"Rerunning table {args.table} of service {args.service}")
+            processing_results[args.service] = process_service(
+                bq_client,
+                csv_reader,
+                config,
+                args.service,
+                args.date,
+                args.table,
+                csv_files=csv_files_by_service[args.service],
+                report_file_result=functools.partial(report_file_result, args.service),
+                dataset_name=dataset_by_service[args.service],
             )
-        else:
-            # MSSQL: validate single table by invoking MSSQL-specific validator methods
-            service = args.service
-            dataset_name = get_dataset_name(config, service).lower()
-            mssql_db = config.get("mssql", {}).get("database")
+        elif not args.validate_only:
+            logger.info("Starting data processing")
 
-            completeness = validator.validate_completeness_mssql(
-                dataset_name, mssql_db, tables=[args.table]
-            )
-            correctness = validator.validate_correctness_mssql(
-                dataset_name, mssql_db, tables=[args.table]
+            # Determine number of workers based on services count (limit to 5 by
+            # default to avoid API rate limits)
+            max_workers = max(
+                1, min(len(services), config.get("max_service_workers", 5))
             )
 
-            validation_results = {
-                "status": "success"
-                if completeness["status"] == "success"
-                and correctness["status"] == "success"
-                else "warning",
-                "service": args.service,
-                "table": args.table,
-                "completeness": completeness,
-                "correctness": correctness,
-            }
-    else:
-        # Validate all services
-        if args.validate_source == "gcs":
-            validation_results = validate_results(
-                validator, config, services, args.date
+            # One pool for per-file load submissions, shared by every service so
+            # the number of concurrent BigQuery requests stays bounded
+            load_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=config.get("max_concurrent_loads", 16)
             )
-        else:
-            # MSSQL-based validation across services uses the MSSQL client database scope
-            validation_results = {
-                "status": "success",
-                "message": "Validation completed",
-                "services": {},
-            }
-            mssql_db = config.get("mssql", {}).get("database")
-            for service in services:
-                service_name_for_dataset = service.replace("-", "_")
-                dataset_name = get_dataset_name(
-                    config, service_name_for_dataset
-                ).lower()
+
+            with load_executor, concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = []
+                for service in services:
+                    specific_table = args.table if args.rerun else None
+                    skip_tables = None
+                    if resume:
+                        skip_tables = run_cache.loaded_tables(
+                            args.date, service, versions_by_service.get(service, {})
+                        )
+                    future = executor.submit(
+                        process_service,
+                        bq_client,
+                        csv_reader,
+                        config,
+                        service,
+                        args.date,
+                        specific_table,
+                        load_executor,
+                        csv_files_by_service[service],
+                        functools.partial(report_file_result, service),
+                        dataset_by_service[service],
+                        skip_tables,
+                    )
+                    futures.append(future)
+
+                # Collect results as they complete
+                for future in concurrent.futures.as_completed(futures):
+                    result = future.result()
+                    processing_results[result["service"]] = result
+
+        # Validate results
+        if args.rerun and args.table:
+            # Validate only the specific table
+            if args.validate_source == "gcs":
+                validation_results = validate_single_service_table(
+                    validator,
+                    config,
+                    args.service,
+                    args.table,
+                    args.date,
+                    csv_files_by_service[args.service],
+                    dataset_by_service[args.service],
+                )
+            else:
+                # MSSQL: validate single table by invoking MSSQL-specific
+                # validator methods
+                dataset_name = dataset_by_service[args.service]
+                mssql_db = config.get("mssql", {}).get("database")
 
                 completeness = validator.validate_completeness_mssql(
-                    dataset_name, mssql_db
+                    dataset_name, mssql_db, tables=[args.table]
                 )
                 correctness = validator.validate_correctness_mssql(
-                    dataset_name, mssql_db
+                    dataset_name, mssql_db, tables=[args.table]
                 )
 
-                validation_results["services"][service] = {
-                    "completeness": completeness,
-                    "correctness": correctness,
+                validation_results = {
                     "status": "success"
-                    if completeness.get("status") == "success"
-                    and correctness.get("status") == "success"
+                    if completeness["status"] == "success"
+                    and correctness["status"] == "success"
                     else "warning",
+                    "service": args.service,
+                    "table": args.table,
+                    "completeness": completeness,
+                    "correctness": correctness,
                 }
+        else:
+            # Validate all services
+            if args.validate_source == "gcs":
+                validation_results = validate_results(
+                    validator,
+                    config,
+                    services,
+                    args.date,
+                    csv_files_by_service,
+                    dataset_by_service,
+                )
+            else:
+                # MSSQL-based validation across services uses the MSSQL client database scope
+                validation_results = {
+                    "status": "success",
+                    "message": "Validation completed",
+                    "services": {},
+                }
+                mssql_db = config.get("mssql", {}).get("database")
+                for service in services:
+                    dataset_name = dataset_by_service[service]
 
-            # Collapse overall status
-            overall_ok = all(
-                v["status"] == "success"
-                for v in validation_results["services"].values()
-            )
-            if not overall_ok:
-                validation_results["status"] = "warning"
-
-    # Generate report
-    report = {
-        "config": args.config,
-        "date": args.date,
-        "validate_only": args.validate_only,
-        "services_processed": services,
-        "rerun": args.rerun,
-        "specific_table": args.table if args.rerun else None,
-        "processing_results": processing_results,
-        "validation_results": validation_results,
-    }
+                    completeness = validator.validate_completeness_mssql(
+                        dataset_name, mssql_db
+                    )
+                    correctness = validator.validate_correctness_mssql(
+                        dataset_name, mssql_db
+                    )
 
-    # Save report to file
+                    validation_results["services"][service] = {
+                        "completeness": completeness,
+                        "correctness": correctness,
+                        "status": "success"
+                        if completeness.get("status") == "success"
+                        and correctness.get("status") == "success"
+                        else "warning",
+                    }
+
+                # Collapse overall status
+                overall_ok = all(
+                    v["status"] == "success"
+                    for v in validation_results["services"].values()
+                )
+                if not overall_ok:
+                    validation_results["status"] = "warning"
+
+        # Generate report; per-file results are already in the NDJSON stream
+        report = {
+            "config": args.config,
+            "date": args.date,
+            "validate_only": args.validate_only,
+            "services_processed": services,
+            "rerun": args.rerun,
+            "specific_table": args.table if args.rerun else None,
+            "processing_results": processing_results,
+            "validation_results": validation_results,
+        }
+        write_report_line("summary", None, report)
+    finally:
+        # Close on every exit so the NDJSON stream is flushed and the cache
+        # connection released even when processing or validation fails
+        if report_stream is not None:
+            report_stream.close()
+        if run_cache:
+            run_cache.close()
+
+    # Save the summary on its own as well, pretty-printed for humans
     report_file = f"csv2bq_report_{args.date}.json"
     with open(report_file, "w") as f:
-        json.dump(report, f, indent=2)
+        f.write(_json_dumps(report, pretty=True))
 
-    logger.info(f"Report saved to {report_file}")
+    logger.info(f"Report saved to {report_file} and {report_stream_file}")
 
     # Log summary
     logger.info("=== Processing Summary ===")
@@ -1,11 +1,19 @@
 import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from os import getenv
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pyodbc
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+
+
+def _quote_identifier(name: str) -> str:
+    """Bracket-quote a SQL Server identifier, escaping any closing bracket."""
+    return "[" + name.replace("]", "]]") + "]"
 
 
 class MSSQLClient:
@@ -14,6 +22,9 @@ class MSSQLClient:
         connection_string: Optional[str] = None,
         driver: str = "{ODBC Driver 17 for SQL Server}",
         timeout: int = 30,
+        pool_size: int = 4,
+        idle_timeout: float = 300,
+        catalog_ttl: float = 600,
     ):
         """
         MSSQL Client for connecting to SQL Server and executing queries.
@@ -25,6 +36,11 @@ class MSSQLClient:
             password: SQL authentication password
             driver: ODBC driver
             timeout: Connection timeout in seconds
+            pool_size: Maximum number of idle connections kept for reuse
+            idle_timeout: Seconds a pooled connection may sit idle before it
+                is closed instead of reused
+            catalog_ttl: Seconds a fetched table catalog is trusted before
+                get_catalog queries it again
         """
 
         # This client prefers an explicit ODBC-style connection string. If the
@@ -37,8 +53,27 @@ class MSSQLClient:
         self.connection_string = connection_string
         self.driver = driver
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+
+        # pyodbc connections must not be shared between threads, and the
+        # validators query from several at once; each query checks out its own
+        # connection and hands it back here, with the time it was released, for
+        # the next one to reuse
+        self._pool: "queue.LifoQueue[Tuple[pyodbc.Connection, float]]" = (
+            queue.LifoQueue(maxsize=pool_size)
+        )
 
-        self.cnxn = None
+        # Table catalogs fetched by get_catalog, keyed by database name (None
+        # for the connection's database)
+        self.catalog_ttl = catalog_ttl
+        self._catalogs: Dict[
+            Optional[str], Tuple[Dict[str, Dict[str, Any]], float]
+        ] = {}
+        self._catalogs_lock = threading.Lock()
+        # Row counts of every table in the connection's database, with the
+        # time they were read; shares catalog_ttl and the catalogs lock
+        self._row_counts: Optional[Tuple[Dict[str, int], float]] = None
         # Do not eagerly open a connection -- attempt to connect lazily
         # caller can also call connect() explicitly or use test_connection()
 
@@ -54,46 +89,116 @@ class MSSQLClient:
         parameters.
         """
         try:
-            # Require an explicit connection string: either supplied to the
-            # constructor or available via SQL_CONNECTION_STRING in the
-            # environment (e.g., a .env file). This avoids implicit or
-            # partially-specified connection data.
-            conn_str = self.connection_string or getenv("SQL_CONNECTION_STRING")
-
-            if not conn_str:
-                # Fail fast and avoid attempting to assemble a connection
-                # string from pieces — the caller should supply a complete ODBC
-                # connection string.
-                logger.error(
-                    "No MSSQL connection string provided. Set `connection_string` or SQL_CONNECTION_STRING env var."
-                )
-                return False
-
-            logger.info("Connecting to SQL Server...")
-            # pass timeout to pyodbc; it's also honored in the connection string
-            self.cnxn = pyodbc.connect(conn_str, timeout=self.timeout)
-            logger.info("SQL Server connection established")
+            self._release_connection(self._open_connection())
             return True
 
         except Exception as e:
             logger.error(f"Failed to connect to SQL Server: {e}")
-            self.cnxn = None
             return False
 
+    def _open_connection(self) -> "pyodbc.Connection":
+        """
+        Open a new connection to SQL Server.
+
+        Raises:
+            RuntimeError: If no connection string is configured
+            pyodbc.Error: If the connection fails
+        """
+        # Require an explicit connection string: either supplied to the
+        # constructor or available via SQL_CONNECTION_STRING in the
+        # environment (e.g., a .env file). This avoids implicit or
+        # partially-specified connection data.
+        conn_str = self.connection_string or getenv("SQL_CONNECTION_STRING")
+
+        if not conn_str:
+            # Fail fast and avoid attempting to assemble a connection
+            # string from pieces — the caller should supply a complete ODBC
+            # connection string.
+            raise RuntimeError(
+                "No MSSQL connection string provided. Set `connection_string` or SQL_CONNECTION_STRING env var."
+            )
+
+        logger.info("Connecting to SQL Server...")
+        # pass timeout to pyodbc; it's also honored in the connection string.
+        # Every query here is a read, so there is no transaction to commit
+        cnxn = pyodbc.connect(conn_str, timeout=self.timeout, autocommit=True)
+        logger.info("SQL Server connection established")
+        return cnxn
+
+    def _release_connection(self, cnxn: "pyodbc.Connection") -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self._pool.put_nowait((cnxn, time.monotonic()))
+        except queue.Full:
+            cnxn.close()
+
+    @contextmanager
+    def _acquire_connection(self) -> Iterator["pyodbc.Connection"]:
+        """
+        Check out a pooled connection, opening a new one if none is idle.
+
+        Connections idle for longer than idle_timeout are closed on the way
+        out, since the server or a firewall may already have dropped them. A
+        connection whose query failed or was abandoned part-way (including a
+        streaming generator closed early) is closed rather than reused, since
+        it may be broken or still holding an unread result.
+        """
+        cnxn = None
+        while cnxn is None:
+            try:
+                cnxn, released_at = self._pool.get_nowait()
+            except queue.Empty:
+                cnxn = self._open_connection()
+                break
+            if time.monotonic() - released_at > self.idle_timeout:
+                try:
+                    cnxn.close()
+                except pyodbc.Error:
+                    pass
+                cnxn = None
+
+        try:
+            yield cnxn
+        except BaseException:
+            try:
+                cnxn.close()
+            except pyodbc.Error:
+                pass
+            raise
+        else:
+            self._release_connection(cnxn)
+
     def _execute_query(self, query: str, params: Optional[List[Any]] = None):
         """
         Execute a SQL query safely with optional parameters.
         """
-        if not self.cnxn:
-            connected = self.connect()
-            if not connected:
-                raise RuntimeError("No active DB connection and connect() failed")
+        return list(self._iter_query(query, params))
 
+    def _iter_query(
+        self,
+        query: str,
+        params: Optional[List[Any]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        """
+        Execute a SQL query and yield its rows as they are fetched.
+
+        Rows arrive in fetchmany batches of batch_size, so a large result is
+        never held in full by the driver and the caller at the same time. The
+        connection stays checked out until the iterator is exhausted.
+        """
         try:
-            cursor = self.cnxn.cursor()
-            logger.debug("Executing query", extra={"query": query})
-            cursor.execute(query) if not params else cursor.execute(query, params)
-            return cursor.fetchall()
+            with self._acquire_connection() as cnxn:
+                cursor = cnxn.cursor()
+                cursor.arraysize = batch_size
+                logger.debug("Executing query", extra={"query": query})
+                cursor.execute(query) if not params else cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+                cursor.close()
         except Exception as e:
             logger.error(f"Error executing query: {e}")
             raise
@@ -101,32 +206,108 @@ class MSSQLClient:
     # --------------------------------------------------------
     # TABLE LISTING
     # --------------------------------------------------------
-    def list_tables(self, database_name: Optional[str] = None) -> List[str]:
+    def get_catalog(
+        self, database_name: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Return list of table names in a SQL Server database.
+        Return every base table with its row count and schema in one query.
+
+        The result is kept for catalog_ttl seconds, and get_row_count and
+        get_table_schema answer from it instead of querying per table.
 
         Args:
             database_name: Optional database name. If not provided, uses the database from the connection string.
+
+        Returns:
+            Dict mapping table name -> {"row_count": int or None, "schema":
+            {column name: data type}}; row_count is None when partition stats
+            are not readable
         """
+        with self._catalogs_lock:
+            cached = self._catalogs.get(database_name)
+            if cached and time.monotonic() - cached[1] <= self.catalog_ttl:
+                return cached[0]
+
         # If database_name is not provided, use INFORMATION_SCHEMA without database qualifier
         # This will use the database specified in the connection string
-        if database_name:
-            query = f"""
-            SELECT TABLE_NAME
-            FROM {database_name}.INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_TYPE = 'BASE TABLE'
-            ORDER BY TABLE_NAME;
-            """
-        else:
-            query = """
-            SELECT TABLE_NAME
-            FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_TYPE = 'BASE TABLE'
-            ORDER BY TABLE_NAME;
-            """
+        db = f"{_quote_identifier(database_name)}." if database_name else ""
+        tables_and_columns = f"""
+            FROM {db}INFORMATION_SCHEMA.TABLES t
+            JOIN {db}INFORMATION_SCHEMA.COLUMNS c
+              ON c.TABLE_SCHEMA = t.TABLE_SCHEMA AND c.TABLE_NAME = t.TABLE_NAME
+        """
+        order = """
+            WHERE t.TABLE_TYPE = 'BASE TABLE'
+            ORDER BY t.TABLE_NAME, c.ORDINAL_POSITION;
+        """
+        try:
+            catalog = self._build_catalog(
+                self._iter_query(
+                    f"""
+                SELECT t.TABLE_NAME, p.row_count, c.COLUMN_NAME, c.DATA_TYPE
+                {tables_and_columns}
+                LEFT JOIN (
+                    SELECT object_id, SUM(row_count) AS row_count
+                    FROM {db}sys.dm_db_partition_stats
+                    WHERE index_id IN (0, 1)
+                    GROUP BY object_id
+                ) p ON p.object_id = OBJECT_ID(
+                    QUOTENAME(t.TABLE_CATALOG) + '.' + QUOTENAME(t.TABLE_SCHEMA)
+                    + '.' + QUOTENAME(t.TABLE_NAME)
+                )
+                {order}
+                """
+                )
+            )
+        except pyodbc.Error as e:
+            # Reading the DMV needs VIEW DATABASE STATE permission
+            logger.warning(
+                f"Partition stats unavailable, listing tables without row counts: {e}"
+            )
+            catalog = self._build_catalog(
+                self._iter_query(
+                    f"""
+                SELECT t.TABLE_NAME, NULL, c.COLUMN_NAME, c.DATA_TYPE
+                {tables_and_columns}
+                {order}
+                """
+                )
+            )
+
+        with self._catalogs_lock:
+            self._catalogs[database_name] = (catalog, time.monotonic())
+        return catalog
+
+    @staticmethod
+    def _build_catalog(rows: Iterator[Any]) -> Dict[str, Dict[str, Any]]:
+        """Fold (table, row count, column, type) rows into a catalog dict."""
+        catalog: Dict[str, Dict[str, Any]] = {}
+        for table_name, row_count, column_name, data_type in rows:
+            entry = catalog.setdefault(
+                table_name, {"row_count": row_count, "schema": {}}
+            )
+            entry["schema"][column_name] = data_type
+        return catalog
+
+    def _catalog_entry(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """Return the catalog entry for a table if a fetched catalog has it."""
+        now = time.monotonic()
+        with self._catalogs_lock:
+            for catalog, fetched_at in self._catalogs.values():
+                if now - fetched_at > self.catalog_ttl:
+                    continue
+                if table_name in catalog:
+                    return catalog[table_name]
+        return None
+
+    def list_tables(self, database_name: Optional[str] = None) -> List[str]:
+        """
+        Return list of table names in a SQL Server database.
 
-        rows = self._execute_query(query)
-        tables = [row[0] for row in rows]
+        Args:
+            database_name: Optional database name. If not provided, uses the database from the connection string.
+        """
+        tables = sorted(self.get_catalog(database_name))
 
         logger.info(f"Found {len(tables)} tables in SQL Server database")
         return tables
@@ -134,15 +315,75 @@ class MSSQLClient:
     # --------------------------------------------------------
     # ROW COUNT PER TABLE
     # --------------------------------------------------------
-    def get_row_count(self, table_name: str) -> int:
+    def get_all_row_counts(self) -> Dict[str, int]:
         """
-        Return number of rows in a SQL Server table.
+        Return the row count of every table in the connection's database.
+
+        One sys.dm_db_partition_stats query serves all tables, and the result
+        is kept for catalog_ttl seconds. When the DMV is not readable, an empty
+        dict is cached so callers fall back to COUNT_BIG(*) without retrying.
+
+        Returns:
+            Dict mapping table name -> row count, for tables in the default
+            schema (the ones an unqualified table name resolves to)
         """
-        query = f"SELECT COUNT(*) FROM [{table_name}]"
+        with self._catalogs_lock:
+            cached = self._row_counts
+            if cached and time.monotonic() - cached[1] <= self.catalog_ttl:
+                return cached[0]
 
+        # Heap (0) or clustered index (1) partitions hold every row once
         try:
-            rows = self._execute_query(query)
-            row_count = rows[0][0] if rows else 0
+            counts = {
+                name: row_count
+                for name, row_count in self._iter_query(
+                    """
+                    SELECT OBJECT_NAME(object_id), SUM(row_count)
+                    FROM sys.dm_db_partition_stats
+                    WHERE index_id IN (0, 1)
+                      AND OBJECT_SCHEMA_NAME(object_id) = SCHEMA_NAME()
+                      AND OBJECTPROPERTY(object_id, 'IsUserTable') = 1
+                    GROUP BY object_id
+                    """
+                )
+            }
+        except pyodbc.Error as e:
+            # Reading the DMV needs VIEW DATABASE STATE permission
+            logger.warning(f"Partition stats unavailable, counting rows instead: {e}")
+            counts = {}
+
+        with self._catalogs_lock:
+            self._row_counts = (counts, time.monotonic())
+        return counts
+
+    def get_row_count(self, table_name: str, use_exact: bool = False) -> int:
+        """
+        Return number of rows in a SQL Server table.
+
+        By default the count is read from sys.dm_db_partition_stats, which SQL
+        Server keeps as metadata, instead of scanning the table with COUNT_BIG(*).
+        Tables outside a fetched catalog are looked up in get_all_row_counts,
+        so counting many tables costs one query.
+
+        Args:
+            table_name: Table to count
+            use_exact: Always run COUNT_BIG(*), e.g. while rows are still being
+                written and metadata may lag uncommitted changes
+        """
+        try:
+            row_count = None
+            entry = None if use_exact else self._catalog_entry(table_name)
+            if entry:
+                row_count = entry["row_count"]
+            elif not use_exact:
+                # Missing for views and tables outside the default schema
+                row_count = self.get_all_row_counts().get(table_name)
+
+            if row_count is None:
+                rows = self._execute_query(
+                    f"SELECT COUNT_BIG(*) FROM {_quote_identifier(table_name)}"
+                )
+                row_count = rows[0][0] if rows else 0
             logger.info(f"Row count for table {table_name}: {row_count}")
             return row_count
         except Exception as e:
@@ -156,46 +397,80 @@ class MSSQLClient:
         Returns:
             Dict mapping column name -> data type (as string)
         """
-        query = f"""
-        SELECT COLUMN_NAME, DATA_TYPE
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_NAME = '{table_name}'
-        ORDER BY ORDINAL_POSITION
+        entry = self._catalog_entry(table_name)
+        if entry:
+            return dict(entry["schema"])
+
+        # Bound rather than interpolated, so any table name is safe and SQL
+        # Server reuses one cached plan for every table. The catalog views are
+        # read directly with an object_id seek; the type expression matches
+        # INFORMATION_SCHEMA.COLUMNS.DATA_TYPE (base type for alias types).
+        # The name is matched in any schema, preferring the caller's default
+        query = """
+        SELECT c.name, COALESCE(TYPE_NAME(c.system_type_id), t.name)
+        FROM sys.columns c
+        JOIN sys.types t ON t.user_type_id = c.user_type_id
+        WHERE c.object_id = (
+            SELECT TOP 1 o.object_id
+            FROM sys.objects o
+            WHERE o.name = ? AND o.type IN ('U', 'V')
+            ORDER BY CASE WHEN o.schema_id = SCHEMA_ID() THEN 0 ELSE 1 END,
+                o.schema_id
+        )
+        ORDER BY c.column_id
         """
 
         try:
-            rows = self._execute_query(query)
+            rows = self._execute_query(query, [table_name])
             schema = {row[0]: row[1] for row in rows}
-            logger.info(f"Schema for {table_name}: {schema}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Schema for {table_name}: {schema}")
             return schema
         except Exception as e:
             logger.error(f"Failed to get schema for {table_name}: {e}")
             return {}
 
     def get_sample_rows(
-        self, table_name: str, sample_size: int = 100
+        self, table_name: str, sample_size: int = 100, strict_random: bool = False
     ) -> Optional[list]:
         """
         Return a sample of rows from the table as list of dicts.
 
-        On SQL Server, ORDER BY NEWID() is a common way to randomize rows.
+        TABLESAMPLE picks whole data pages, so SQL Server reads only a fraction
+        of the table instead of sorting all of it by NEWID(). Page sampling
+        can come back empty on small tables; those fall back to the first rows.
+
+        Args:
+            table_name: Table to sample
+            sample_size: Number of rows to return
+            strict_random: Sample individual rows with ORDER BY NEWID(), which
+                sorts the whole table, when page-level sampling is too coarse
         """
         try:
-            # First get columns
-            schema = self.get_table_schema(table_name)
-            if not schema:
-                return None
-            cols = ", ".join([f"[{c}]" for c in schema.keys()])
-            query = f"SELECT TOP ({sample_size}) {cols} FROM [{table_name}] ORDER BY NEWID()"
-            if not self.cnxn:
-                connected = self.connect()
-                if not connected:
-                    return None
-
-            cursor = self.cnxn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            col_names = [desc[0] for desc in cursor.description]
+            # SELECT * returns the columns in ordinal order, so no separate
+            # schema lookup is needed; a missing table raises and returns None
+            table = _quote_identifier(table_name)
+            if strict_random:
+                queries = (
+                    f"SELECT TOP ({sample_size}) * FROM {table} ORDER BY NEWID()",
+                )
+            else:
+                sampled_rows = max(sample_size * 10, 1000)
+                queries = (
+                    f"SELECT TOP ({sample_size}) * FROM {table} "
+                    f"TABLESAMPLE ({sampled_rows} ROWS)",
+                    f"SELECT TOP ({sample_size}) * FROM {table}",
+                )
+            with self._acquire_connection() as cnxn:
+                cursor = cnxn.cursor()
+                cursor.arraysize = sample_size
+                for query in queries:
+                    cursor.execute(query)
+                    rows = cursor.fetchmany(sample_size)
+                    if rows:
+                        break
+                col_names = tuple(desc[0] for desc in cursor.description)
+                cursor.close()
             # Convert to list of dicts
             result = [dict(zip(col_names, row)) for row in rows]
             return result
@@ -210,7 +485,7 @@ class MSSQLClient:
         Returns True if the client can successfully execute the test_query, False otherwise.
         """
         # Ensure connected and run a tiny query
-        if not self.cnxn:
+        if self._pool.empty():
             ok = self.connect()
             if not ok:
                 logger.error("MSSQL connectivity test failed: unable to connect")
@@ -0,0 +1,197 @@
+"""
+Local SQLite cache of GCS listings and load outcomes, kept across runs
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class RunCache:
+    """Remembers what earlier runs listed and loaded so reruns can skip work"""
+
+    def __init__(self, path: str = "csv2bq_cache.sqlite", listing_ttl: float = 3600):
+        """
+        Open (or create) the cache database
+
+        Args:
+            path: SQLite database file
+            listing_ttl: Seconds a recorded GCS listing may be reused
+        """
+        self.path = path
+        self.listing_ttl = listing_ttl
+
+        # Service workers report results from several threads; one connection
+        # guarded by a lock keeps SQLite writes serialized
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS gcs_listing (
+                date TEXT NOT NULL,
+                service TEXT NOT NULL,
+                csv_files TEXT NOT NULL,
+                ts REAL NOT NULL,
+                PRIMARY KEY (date, service)
+            );
+            CREATE TABLE IF NOT EXISTS loaded (
+                date TEXT NOT NULL,
+                service TEXT NOT NULL,
+                table_name TEXT NOT NULL,
+                job_id TEXT,
+                status TEXT NOT NULL,
+                ts REAL NOT NULL,
+                file_versions TEXT,
+                PRIMARY KEY (date, service, table_name)
+            );
+            """
+        )
+
+        # Databases written before file versions were recorded lack the column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(loaded)")}
+        if "file_versions" not in columns:
+            self._conn.execute("ALTER TABLE loaded ADD COLUMN file_versions TEXT")
+
+    def get_listing(
+        self, date: str, service: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get the CSV files recorded for a service's export
+
+        Args:
+            date: Date folder of the export
+            service: Service name
+
+        Returns:
+            Dictionary mapping each CSV file path (in listing order) to its GCS
+            generation, or None if the service was never listed or the listing
+            is older than listing_ttl
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT csv_files, ts FROM gcs_listing "
+                    "WHERE date = ? AND service = ?",
+                    (date, service),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading cached listing for {service}: {e}")
+            return None
+
+        if not row or time.time() - row[1] > self.listing_ttl:
+            return None
+        csv_files = json.loads(row[0])
+        if isinstance(csv_files, list):
+            # Listings recorded before generations were kept
+            return dict.fromkeys(csv_files)
+        return csv_files
+
+    def store_listing(
+        self, date: str, service: str, csv_files: Dict[str, Optional[str]]
+    ) -> None:
+        """
+        Record the CSV files found for a service's export
+
+        Args:
+            date: Date folder of the export
+            service: Service name
+            csv_files: CSV file path -> GCS generation (None if unknown)
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO gcs_listing VALUES (?, ?, ?, ?)",
+                    (date, service, json.dumps(csv_files), time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error caching listing for {service}: {e}")
+
+    def loaded_tables(
+        self,
+        date: str,
+        service: str,
+        file_versions: Optional[Dict[str, Dict[str, Optional[str]]]] = None,
+    ) -> Set[str]:
+        """
+        Get the tables whose last load for this export succeeded
+
+        Args:
+            date: Date folder of the export
+            service: Service name
+            file_versions: Current table -> {CSV file: GCS generation}; when
+                given, a table counts as loaded only if it was loaded from
+                exactly these file versions
+
+        Returns:
+            Set of table names
+        """
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT table_name, file_versions FROM loaded "
+                    "WHERE date = ? AND service = ? AND status = 'success'",
+                    (date, service),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading loaded tables for {service}: {e}")
+            return set()
+
+        if file_versions is None:
+            return {row[0] for row in rows}
+
+        tables = set()
+        for table_name, recorded in rows:
+            current = file_versions.get(table_name)
+            # Unknown generations can't prove the files are unchanged
+            if not current or None in current.values() or not recorded:
+                continue
+            if json.loads(recorded) == current:
+                tables.add(table_name)
+        return tables
+
+    def mark_loaded(
+        self,
+        date: str,
+        service: str,
+        table_name: str,
+        success: bool,
+        job_id: Optional[str] = None,
+        file_versions: Optional[Dict[str, Optional[str]]] = None,
+    ) -> None:
+        """
+        Record the outcome of loading a table
+
+        Args:
+            date: Date folder of the export
+            service: Service name
+            table_name: Table that was loaded
+            success: Whether the load (and MERGE, for upserts) succeeded
+            job_id: BigQuery job that did the final write, if any
+            file_versions: CSV file -> GCS generation of the files loaded
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO loaded VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        date,
+                        service,
+                        table_name,
+                        job_id,
+                        "success" if success else "failed",
+                        time.time(),
+                        json.dumps(file_versions) if file_versions else None,
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error recording load of {table_name}: {e}")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -1,18 +1,35 @@
-# connection to mssql server with python and this conn string 
 """
-Connects to a SQL database using mssql-python
+Smoke test for the MSSQL connection string in SQL_CONNECTION_STRING
 """
 
-from os import getenv 
-from dotenv import load_dotenv 
-import pyodbc # Make sure you import pyodbc
+import logging
+import sys
 
-load_dotenv()  # take environment variables from .env.
+# Load environment variables from .env file
+try:
+    from dotenv import load_dotenv
 
-# The entire connection string is read from the environment variable as one string
-connection_string = getenv("SQL_CONNECTION_STRING") 
+    load_dotenv()
+except ImportError:
+    pass  # dotenv not available, user must have environment variables set
 
-# Pass the single string to the connect function
-conn = pyodbc.connect(connection_string) 
-print("connection successful")
-# ... rest of your code ...
+try:
+    from mssql_client import MSSQLClient
+except ImportError:
+    from src.mssql_client import MSSQLClient
+
+
+def main() -> int:
+    """Connect with the same client the pipeline uses and run a test query"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    if not MSSQLClient().test_connection():
+        return 1
+    print("connection successful")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,11 @@
 Validation module for verifying data integrity between CSV source and BigQuery destination
 """
 
+import concurrent.futures
+import functools
 import logging
-import random
-from typing import Any, Dict, List, Optional, Tuple
-
-import pandas as pd
+import os
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 try:
     from bigquery_client import BigQueryClient
@@ -17,6 +17,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Source type names accepted as equivalent to a BigQuery type
+_TYPE_MAPPINGS = {
+    "INT": "INTEGER",
+    "FLOAT64": "FLOAT",
+}
+
 
 class Validator:
     """Validator for checking completeness and correctness of ETL process"""
@@ -26,6 +32,8 @@ class Validator:
         bigquery_client: BigQueryClient,
         csv_reader: CSVReader,
         sample_size: int = 100,
+        max_workers: int = 4,
+        allow_quoted_newlines: bool = True,
     ):
         """
         Initialize validator with BigQuery client and CSV reader
@@ -34,14 +42,23 @@ class Validator:
             bigquery_client: BigQuery client instance
             csv_reader: CSV reader instance
             sample_size: Number of rows to sample for validation
+            max_workers: Files or tables checked concurrently per validation
+            allow_quoted_newlines: If False, count CSV rows with a raw newline
+                scan instead of parsing (faster, but wrong for embedded
+                newlines)
         """
         self.bigquery_client = bigquery_client
         self.csv_reader = csv_reader
         self.sample_size = sample_size
+        self.max_workers = max_workers
+        self.allow_quoted_newlines = allow_quoted_newlines
         self.validation_results = {}
 
     def validate_completeness_gcs(
-        self, dataset_name: str, gcs_path: str
+        self,
+        dataset_name: str,
+        gcs_path: str,
+        csv_files: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Validate completeness of ETL process with GCS source
@@ -49,6 +66,7 @@ class Validator:
         Args:
             dataset_name: BigQuery dataset name
             gcs_path: GCS path containing CSV files
+            csv_files: CSV files under gcs_path if already listed by the caller
 
         Returns:
             Dictionary with validation results
@@ -56,7 +74,8 @@ class Validator:
         logger.info(f"Starting completeness validation for dataset: {dataset_name}")
 
         # Get list of CSV files in GCS
-        csv_files = self.csv_reader.list_csv_files_in_gcs(gcs_path)
+        if csv_files is None:
+            csv_files = self.csv_reader.list_csv_files_in_gcs(gcs_path)
         if not csv_files:
             return {
                 "status": "failed",
@@ -75,37 +94,29 @@ class Validator:
         total_csv_rows = 0
         total_bq_rows = 0
 
-        for csv_file in csv_files:
-            # Extract table name from file name
-            table_name = self._extract_table_name_from_path(csv_file)
-            if not table_name:
+        # One metadata query for every table instead of a lookup per file
+        bq_row_counts = self.bigquery_client.get_row_counts(dataset_name)
+
+        file_results = self._map_concurrently(
+            functools.partial(
+                self._check_file_completeness,
+                dataset_name,
+                bq_row_counts,
+                functools.partial(
+                    self.csv_reader.get_row_count_gcs,
+                    allow_quoted_newlines=self.allow_quoted_newlines,
+                ),
+            ),
+            csv_files,
+        )
+        for file_result in file_results:
+            if file_result is None:
                 continue
-
-            # Get row counts
-            csv_row_count = self.csv_reader.get_row_count_gcs(csv_file)
-            bq_row_count = self.bigquery_client.get_row_count(dataset_name, table_name)
-            total_csv_rows += csv_row_count
-            total_bq_rows += bq_row_count
-
-            # Check if table exists and row counts match
-            table_exists = self.bigquery_client.table_exists(dataset_name, table_name)
-            rows_match = csv_row_count == bq_row_count
-
-            file_result = {
-                "file_path": csv_file,
-                "table_name": table_name,
-                "table_exists": table_exists,
-                "csv_rows": csv_row_count,
-                "bq_rows": bq_row_count,
-                "rows_match": rows_match,
-                "status": "success" if rows_match else "failed",
-            }
-
             results["details"]["file_results"].append(file_result)
-
-            if not rows_match:
+            total_csv_rows += file_result["csv_rows"]
+            total_bq_rows += file_result["bq_rows"]
+            if not file_result["rows_match"]:
                 all_files_processed = False
-
         results["details"]["all_files_processed"] = all_files_processed
         results["details"]["total_csv_rows"] = total_csv_rows
         results["details"]["total_bq_rows"] = total_bq_rows
@@ -151,37 +162,29 @@ class Validator:
         total_csv_rows = 0
         total_bq_rows = 0
 
-        for csv_file in csv_files:
-            # Extract table name from file name
-            table_name = self._extract_table_name_from_path(csv_file)
-            if not table_name:
+        # One metadata query for every table instead of a lookup per file
+        bq_row_counts = self.bigquery_client.get_row_counts(dataset_name)
+
+        file_results = self._map_concurrently(
+            functools.partial(
+                self._check_file_completeness,
+                dataset_name,
+                bq_row_counts,
+                functools.partial(
+                    self.csv_reader.get_row_count_local,
+                    allow_quoted_newlines=self.allow_quoted_newlines,
+                ),
+            ),
+            csv_files,
+        )
+        for file_result in file_results:
+            if file_result is None:
                 continue
-
-            # Get row counts
-            csv_row_count = self.csv_reader.get_row_count_local(csv_file)
-            bq_row_count = self.bigquery_client.get_row_count(dataset_name, table_name)
-            total_csv_rows += csv_row_count
-            total_bq_rows += bq_row_count
-
-            # Check if table exists and row counts match
-            table_exists = self.bigquery_client.table_exists(dataset_name, table_name)
-            rows_match = csv_row_count == bq_row_count
-
-            file_result = {
-                "file_path": csv_file,
-                "table_name": table_name,
-                "table_exists": table_exists,
-                "csv_rows": csv_row_count,
-                "bq_rows": bq_row_count,
-                "rows_match": rows_match,
-                "status": "success" if rows_match else "failed",
-            }
-
             results["details"]["file_results"].append(file_result)
-
-            if not rows_match:
+            total_csv_rows += file_result["csv_rows"]
+            total_bq_rows += file_result["bq_rows"]
+            if not file_result["rows_match"]:
                 all_files_processed = False
-
         results["details"]["all_files_processed"] = all_files_processed
         results["details"]["total_csv_rows"] = total_csv_rows
         results["details"]["total_bq_rows"] = total_bq_rows
@@ -193,7 +196,10 @@ class Validator:
         return results
 
     def validate_correctness_gcs(
-        self, dataset_name: str, gcs_path: str
+        self,
+        dataset_name: str,
+        gcs_path: str,
+        csv_files: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Validate correctness of ETL process with GCS source
@@ -201,6 +207,7 @@ class Validator:
         Args:
             dataset_name: BigQuery dataset name
             gcs_path: GCS path containing CSV files
+            csv_files: CSV files under gcs_path if already listed by the caller
 
         Returns:
             Dictionary with validation results
@@ -208,7 +215,8 @@ class Validator:
         logger.info(f"Starting correctness validation for dataset: {dataset_name}")
 
         # Get list of CSV files in GCS
-        csv_files = self.csv_reader.list_csv_files_in_gcs(gcs_path)
+        if csv_files is None:
+            csv_files = self.csv_reader.list_csv_files_in_gcs(gcs_path)
         if not csv_files:
             return {
                 "status": "failed",
@@ -225,47 +233,27 @@ class Validator:
 
         all_files_valid = True
 
-        for csv_file in csv_files:
-            # Extract table name from file name
-            table_name = self._extract_table_name_from_path(csv_file)
-            if not table_name:
-                continue
-
-            # Skip if table doesn't exist
-            if not self.bigquery_client.table_exists(dataset_name, table_name):
+        # Dataset-wide metadata queries instead of lookups per file
+        bq_schemas = self.bigquery_client.get_table_schemas(dataset_name)
+        bq_row_counts = self.bigquery_client.get_row_counts(dataset_name)
+
+        file_results = self._map_concurrently(
+            functools.partial(
+                self._check_file_correctness,
+                dataset_name,
+                bq_schemas,
+                bq_row_counts,
+                self.csv_reader.extract_schema_from_csv_gcs,
+                self._compare_sample_data_gcs,
+            ),
+            csv_files,
+        )
+        for file_result in file_results:
+            if file_result is None:
                 continue
-
-            # Get schemas and compare
-            csv_schema = self.csv_reader.extract_schema_from_csv_gcs(csv_file)
-            bq_table_info = self.bigquery_client.get_table_info(
-                dataset_name, table_name
-            )
-            bq_schema = {
-                field["name"]: field["type"]
-                for field in bq_table_info.get("schema", [])
-            }
-
-            # Check if schemas match
-            schema_match = self._compare_schemas(csv_schema, bq_schema)
-
-            # Sample rows and compare values
-            sample_valid = self._compare_sample_data_gcs(
-                dataset_name, table_name, csv_file
-            )
-
-            file_result = {
-                "file_path": csv_file,
-                "table_name": table_name,
-                "schema_match": schema_match,
-                "sample_match": sample_valid,
-                "status": "success" if schema_match and sample_valid else "failed",
-            }
-
             results["details"]["file_results"].append(file_result)
-
-            if not schema_match or not sample_valid:
+            if file_result["status"] != "success":
                 all_files_valid = False
-
         results["details"]["all_files_valid"] = all_files_valid
 
         if not all_files_valid:
@@ -307,47 +295,27 @@ class Validator:
 
         all_files_valid = True
 
-        for csv_file in csv_files:
-            # Extract table name from file name
-            table_name = self._extract_table_name_from_path(csv_file)
-            if not table_name:
+        # Dataset-wide metadata queries instead of lookups per file
+        bq_schemas = self.bigquery_client.get_table_schemas(dataset_name)
+        bq_row_counts = self.bigquery_client.get_row_counts(dataset_name)
+
+        file_results = self._map_concurrently(
+            functools.partial(
+                self._check_file_correctness,
+                dataset_name,
+                bq_schemas,
+                bq_row_counts,
+                self.csv_reader.extract_schema_from_csv_local,
+                self._compare_sample_data_local,
+            ),
+            csv_files,
+        )
+        for file_result in file_results:
+            if file_result is None:
                 continue
-
-            # Skip if table doesn't exist
-            if not self.bigquery_client.table_exists(dataset_name, table_name):
-                continue
-
-            # Get schemas and compare
-            csv_schema = self.csv_reader.extract_schema_from_csv_local(csv_file)
-            bq_table_info = self.bigquery_client.get_table_info(
-                dataset_name, table_name
-            )
-            bq_schema = {
-                field["name"]: field["type"]
-                for field in bq_table_info.get("schema", [])
-            }
-
-            # Check if schemas match
-            schema_match = self._compare_schemas(csv_schema, bq_schema)
-
-            # Sample rows and compare values
-            sample_valid = self._compare_sample_data_local(
-                dataset_name, table_name, csv_file
-            )
-
-            file_result = {
-                "file_path": csv_file,
-                "table_name": table_name,
-                "schema_match": schema_match,
-                "sample_match": sample_valid,
-                "status": "success" if schema_match and sample_valid else "failed",
-            }
-
             results["details"]["file_results"].append(file_result)
-
-            if not schema_match or not sample_valid:
+            if file_result["status"] != "success":
                 all_files_valid = False
-
         results["details"]["all_files_valid"] = all_files_valid
 
         if not all_files_valid:
@@ -435,7 +403,9 @@ class Validator:
         logger.info(f"Starting completeness validation for table: {table_name}")
 
         # Get row count from CSV
-        csv_row_count = self.csv_reader.get_row_count_gcs(gcs_path)
+        csv_row_count = self.csv_reader.get_row_count_gcs(
+            gcs_path, allow_quoted_newlines=self.allow_quoted_newlines
+        )
 
         # Get row count from BigQuery
         bq_row_count = self.bigquery_client.get_row_count(dataset_name, table_name)
@@ -515,12 +485,236 @@ class Validator:
 
         return results
 
-    def _extract_table_name_from_path(self, file_path: str) -> Optional[str]:
-        """Extract table name from file path"""
-        import os
+    def _map_concurrently(
+        self, func: Callable[[Any], Any], items: List[Any]
+    ) -> List[Any]:
+        """
+        Apply func to every item on a thread pool, keeping the input order
+
+        Each item's checks are independent GCS reads and BigQuery round-trips,
+        so running them side by side hides most of their latency.
+
+        Args:
+            func: Function to call with each item
+            items: Items to process
+
+        Returns:
+            List of results in the same order as items
+        """
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        workers = min(self.max_workers, len(items))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    def _check_file_completeness(
+        self,
+        dataset_name: str,
+        bq_row_counts: Optional[Dict[str, int]],
+        count_csv_rows: Callable[[str], int],
+        csv_file: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Compare one CSV file's row count with its BigQuery table
+
+        Args:
+            dataset_name: BigQuery dataset name
+            bq_row_counts: Row counts of the whole dataset, or None
+            count_csv_rows: Function counting the data rows of a CSV file
+            csv_file: Path to the CSV file
+
+        Returns:
+            File result, or None if no table name can be derived from the path
+        """
+        # Extract table name from file name
+        table_name = self._extract_table_name_from_path(csv_file)
+        if not table_name:
+            return None
+
+        # Get row counts
+        csv_row_count = count_csv_rows(csv_file)
+        bq_row_count, table_exists = self._bq_table_status(
+            bq_row_counts, dataset_name, table_name
+        )
+
+        # Check if row counts match
+        rows_match = csv_row_count == bq_row_count
+
+        return {
+            "file_path": csv_file,
+            "table_name": table_name,
+            "table_exists": table_exists,
+            "csv_rows": csv_row_count,
+            "bq_rows": bq_row_count,
+            "rows_match": rows_match,
+            "status": "success" if rows_match else "failed",
+        }
+
+    def _check_file_correctness(
+        self,
+        dataset_name: str,
+        bq_schemas: Optional[Dict[str, Dict[str, str]]],
+        bq_row_counts: Optional[Dict[str, int]],
+        extract_schema: Callable[[str], Dict[str, str]],
+        compare_sample: Callable[[str, str, str, Set[str]], bool],
+        csv_file: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Compare one CSV file's schema and sample rows with its BigQuery table
+
+        Args:
+            dataset_name: BigQuery dataset name
+            bq_schemas: Column types of every table in the dataset, or None
+            bq_row_counts: Row counts of every table in the dataset, or None
+            extract_schema: Function inferring the schema of a CSV file
+            compare_sample: Function comparing sample rows of a CSV file with
+                its table, called as
+                (dataset_name, table_name, csv_file, bq_columns)
+            csv_file: Path to the CSV file
+
+        Returns:
+            File result, or None if the table name cannot be derived or the
+            table does not exist
+        """
+        # Extract table name from file name
+        table_name = self._extract_table_name_from_path(csv_file)
+        if not table_name:
+            return None
+
+        # Skip if table doesn't exist
+        bq_schema = self._bq_table_schema(bq_schemas, dataset_name, table_name)
+        if bq_schema is None:
+            return None
+
+        # Get schemas and compare
+        csv_schema = extract_schema(csv_file)
+
+        # Check if schemas match
+        schema_match = self._compare_schemas(csv_schema, bq_schema)
+
+        # Sample rows and compare values
+        sample_valid = self._sample_table(
+            dataset_name,
+            table_name,
+            bq_schema,
+            bq_row_counts,
+            functools.partial(compare_sample, dataset_name, table_name, csv_file),
+        )
+
+        return {
+            "file_path": csv_file,
+            "table_name": table_name,
+            "schema_match": schema_match,
+            "sample_match": sample_valid,
+            "status": "success" if schema_match and sample_valid else "failed",
+        }
 
-        base_name = os.path.basename(file_path)
-        table_name = os.path.splitext(base_name)[0]
+    def _sample_table(
+        self,
+        dataset_name: str,
+        table_name: str,
+        bq_schema: Dict[str, str],
+        bq_row_counts: Optional[Dict[str, int]],
+        compare_sample: Callable[[Set[str]], bool],
+    ) -> bool:
+        """
+        Run a sample comparison using already-fetched BigQuery metadata
+
+        Args:
+            dataset_name: BigQuery dataset name
+            table_name: BigQuery table name
+            bq_schema: Column types of the table
+            bq_row_counts: Row counts of every table in the dataset, or None
+            compare_sample: Sample comparison, called with the table's columns
+
+        Returns:
+            True if sample data matches, False otherwise
+        """
+        bq_row_count, _ = self._bq_table_status(
+            bq_row_counts, dataset_name, table_name
+        )
+        if not bq_row_count:
+            logger.warning(f"Empty BigQuery table: {dataset_name}.{table_name}")
+            return False
+        return compare_sample(set(bq_schema))
+
+    def _bq_table_schema(
+        self,
+        bq_schemas: Optional[Dict[str, Dict[str, str]]],
+        dataset_name: str,
+        table_name: str,
+    ) -> Optional[Dict[str, str]]:
+        """
+        Get a BigQuery table's column types
+
+        Args:
+            bq_schemas: Column types of the whole dataset from
+                get_table_schemas, or None if they could not be read
+            dataset_name: BigQuery dataset name
+            table_name: BigQuery table name
+
+        Returns:
+            Dictionary mapping column name to type, or None if the table
+            does not exist
+        """
+        if bq_schemas is not None:
+            return bq_schemas.get(table_name)
+        if not self.bigquery_client.table_exists(dataset_name, table_name):
+            return None
+        bq_table_info = self.bigquery_client.get_table_info(dataset_name, table_name)
+        return {
+            field["name"]: field["type"] for field in bq_table_info.get("schema", [])
+        }
+
+    def _bq_table_columns(
+        self, dataset_name: str, table_name: str
+    ) -> Optional[Set[str]]:
+        """
+        Get the column names of a non-empty BigQuery table from its metadata
+
+        Args:
+            dataset_name: BigQuery dataset name
+            table_name: BigQuery table name
+
+        Returns:
+            Set of column names, or None if the table is missing or empty
+        """
+        table_info = self.bigquery_client.get_table_info(dataset_name, table_name)
+        if not table_info.get("num_rows"):
+            logger.warning(f"Empty BigQuery table: {dataset_name}.{table_name}")
+            return None
+        return {field["name"] for field in table_info.get("schema", [])}
+
+    def _bq_table_status(
+        self,
+        bq_row_counts: Optional[Dict[str, int]],
+        dataset_name: str,
+        table_name: str,
+    ) -> Tuple[int, bool]:
+        """
+        Get a BigQuery table's row count and whether it exists
+
+        Args:
+            bq_row_counts: Row counts of the whole dataset from get_row_counts,
+                or None if they could not be read
+            dataset_name: BigQuery dataset name
+            table_name: BigQuery table name
+
+        Returns:
+            Tuple of (row count, table exists)
+        """
+        if bq_row_counts is not None:
+            return bq_row_counts.get(table_name, 0), table_name in bq_row_counts
+        return (
+            self.bigquery_client.get_row_count(dataset_name, table_name),
+            self.bigquery_client.table_exists(dataset_name, table_name),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_table_name_from_path(file_path: str) -> Optional[str]:
+        """Extract table name from file path"""
+        table_name = os.path.splitext(os.path.basename(file_path))[0]
         return table_name if table_name else None
 
     def _compare_schemas(
@@ -536,32 +730,26 @@ class Validator:
         Returns:
             True if schemas match, False otherwise
         """
-        # Check if column names match
-        csv_columns = set(csv_schema.keys())
-        bq_columns = set(bq_schema.keys())
-
-        if csv_columns != bq_columns:
+        # Check if column names match; key views compare as sets without
+        # copying the keys
+        if csv_schema.keys() != bq_schema.keys():
             logger.warning(
-                f"Column names don't match. CSV: {csv_columns}, BQ: {bq_columns}"
+                f"Column names don't match. CSV: {set(csv_schema)}, "
+                f"BQ: {set(bq_schema)}"
             )
             return False
 
         # Check data types
-        for column in csv_columns:
+        for column in csv_schema:
             csv_type = csv_schema[column]
             bq_type = bq_schema[column]
 
             # Simplified type comparison (can be enhanced)
-            if csv_type.upper() != bq_type.upper():
+            csv_upper = csv_type.upper()
+            bq_upper = bq_type.upper()
+            if csv_upper != bq_upper:
                 # Allow some type mappings
-                type_mappings = {
-                    "INT": "INTEGER",
-                    "FLOAT64": "FLOAT",
-                }
-
-                mapped_type = type_mappings.get(csv_type.upper(), csv_type.upper())
-
-                if mapped_type != bq_type.upper():
+                if _TYPE_MAPPINGS.get(csv_upper, csv_upper) != bq_upper:
                     logger.warning(
                         f"Column {column} type mismatch. CSV: {csv_type}, BQ: {bq_type}"
                     )
@@ -570,7 +758,11 @@ class Validator:
         return True
 
     def _compare_sample_data_gcs(
-        self, dataset_name: str, table_name: str, gcs_path: str
+        self,
+        dataset_name: str,
+        table_name: str,
+        gcs_path: str,
+        bq_columns: Optional[Set[str]] = None,
     ) -> bool:
         """
         Compare sample data between GCS CSV and BigQuery table
@@ -579,33 +771,35 @@ class Validator:
             dataset_name: BigQuery dataset name
             table_name: BigQuery table name
             gcs_path: GCS path to CSV file
+            bq_columns: Column names of the table, if already known to be
+                non-empty; read from table metadata when omitted
 
         Returns:
             True if sample data matches, False otherwise
         """
         try:
-            # Get sample data from CSV
+            # Only the header and one row are needed: the check compares
+            # column names and that the file has data, not values
             csv_df = self.csv_reader.read_csv_to_dataframe_gcs(
-                gcs_path, sample_size=self.sample_size
+                gcs_path, sample_size=1
             )
             if csv_df.empty:
                 logger.warning(f"Empty or unreadable CSV file: {gcs_path}")
                 return False
 
-            # Get sample data from BigQuery
-            query = f"SELECT * FROM `{self.bigquery_client.project_id}.{dataset_name}.{table_name}` ORDER BY RAND() LIMIT {self.sample_size}"
-            bq_df = self.bigquery_client.client.query(query).to_dataframe()
-            if bq_df.empty:
-                logger.warning(f"Empty BigQuery table: {dataset_name}.{table_name}")
+            # BigQuery column names come from table metadata; no rows are read
+            bq_cols = bq_columns
+            if bq_cols is None:
+                bq_cols = self._bq_table_columns(dataset_name, table_name)
+            if bq_cols is None:
                 return False
 
             # For simplicity, just compare row counts and column names
-            if len(csv_df.columns) != len(bq_df.columns):
+            if len(csv_df.columns) != len(bq_cols):
                 return False
 
             # Check if all column names match (order doesn't matter)
             csv_cols = set(csv_df.columns)
-            bq_cols = set(bq_df.columns)
             if csv_cols != bq_cols:
                 return False
 
@@ -615,7 +809,11 @@ class Validator:
             return False
 
     def _compare_sample_data_local(
-        self, dataset_name: str, table_name: str, local_path: str
+        self,
+        dataset_name: str,
+        table_name: str,
+        local_path: str,
+        bq_columns: Optional[Set[str]] = None,
     ) -> bool:
         """
         Compare sample data between local CSV and BigQuery table
@@ -624,33 +822,35 @@ class Validator:
             dataset_name: BigQuery dataset name
             table_name: BigQuery table name
             local_path: Local path to CSV file
+            bq_columns: Column names of the table, if already known to be
+                non-empty; read from table metadata when omitted
 
         Returns:
             True if sample data matches, False otherwise
         """
         try:
-            # Get sample data from CSV
+            # Only the header and one row are needed: the check compares
+            # column names and that the file has data, not values
             csv_df = self.csv_reader.read_csv_to_dataframe_local(
-                local_path, sample_size=self.sample_size
+                local_path, sample_size=1
             )
             if csv_df.empty:
                 logger.warning(f"Empty or unreadable CSV file: {local_path}")
                 return False
 
-            # Get sample data from BigQuery
-            query = f"SELECT * FROM `{self.bigquery_client.project_id}.{dataset_name}.{table_name}` ORDER BY RAND() LIMIT {self.sample_size}"
-            bq_df = self.bigquery_client.client.query(query).to_dataframe()
-            if bq_df.empty:
-                logger.warning(f"Empty BigQuery table: {dataset_name}.{table_name}")
+            # BigQuery column names come from table metadata; no rows are read
+            bq_cols = bq_columns
+            if bq_cols is None:
+                bq_cols = self._bq_table_columns(dataset_name, table_name)
+            if bq_cols is None:
                 return False
 
             # For simplicity, just compare row counts and column names
-            if len(csv_df.columns) != len(bq_df.columns):
+            if len(csv_df.columns) != len(bq_cols):
                 return False
 
             # Check if all column names match (order doesn't matter)
             csv_cols = set(csv_df.columns)
-            bq_cols = set(bq_df.columns)
             if csv_cols != bq_cols:
                 return False
 
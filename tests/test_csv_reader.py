@@ -0,0 +1,60 @@
+"""
+Tests for the column types inferred from CSV samples
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+from io import BytesIO
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+
+def _installed(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+HAS_READER_DEPS = all(
+    _installed(name) for name in ("pandas", "pyarrow", "google.cloud.storage")
+)
+
+SAMPLE_CSV = (
+    b"id,name,signup_date,last_login,score\n"
+    b"1,alice,2024-01-31,2024-01-31 08:15:00,\n"
+    b"2,bob,2024-02-29,2024-02-29 17:45:30,7\n"
+)
+
+
+@unittest.skipUnless(HAS_READER_DEPS, "pandas/pyarrow/google-cloud-storage missing")
+class InferredTypesTest(unittest.TestCase):
+    def test_types_match_bigquery_autodetect(self):
+        from CSV_reader import _bq_type, _read_csv
+
+        df = _read_csv(BytesIO(SAMPLE_CSV))
+        schema = {column: _bq_type(dtype) for column, dtype in df.dtypes.items()}
+
+        # What BigQuery's CSV autodetect picks for the same columns
+        self.assertEqual(
+            schema,
+            {
+                "id": "INTEGER",
+                "name": "STRING",
+                "signup_date": "DATE",
+                "last_login": "TIMESTAMP",
+                "score": "INTEGER",
+            },
+        )
+
+    def test_nrows_zero_reads_no_rows(self):
+        from CSV_reader import _read_csv
+
+        self.assertEqual(len(_read_csv(BytesIO(SAMPLE_CSV), nrows=0)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Tests for grouping the shared GCS listing by service
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+import main  # noqa: E402
+
+
+def _installed(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+HAS_CSV_READER_DEPS = _installed("pandas") and _installed("google.cloud.storage")
+
+
+def _load_default_config():
+    with open(os.path.join(REPO_ROOT, "config.json")) as f:
+        return json.load(f)
+
+
+class FakeCSVReader:
+    """Stands in for CSVReader, serving a fixed GCS listing"""
+
+    def __init__(self, files):
+        self.files = files
+        self.service_folders = None
+
+    def list_csv_files_in_gcs(self, gcs_path, use_cache=True):
+        return [f for f in self.files if f.startswith(gcs_path.lstrip("/"))]
+
+    def list_csv_files_by_service(self, gcs_base_path, service_folders, use_cache=True):
+        self.service_folders = service_folders
+        if HAS_CSV_READER_DEPS:
+            from CSV_reader import CSVReader
+
+            return CSVReader.list_csv_files_by_service(
+                self, gcs_base_path, service_folders, use_cache
+            )
+        return {}
+
+
+class ListCsvFilesByServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.config = _load_default_config()
+        self.date = "20240101"
+        base = f"sql-exports/{self.date}/csvextract"
+        self.files = [
+            f"{base}/dev-auth-service/users.csv",
+            f"{base}/dev-auth-service/roles.csv",
+            f"{base}/dev-career-service/jobs.csv",
+            f"{base}/dev-unknown-service/other.csv",
+        ]
+
+    def test_folders_follow_rendered_template(self):
+        reader = FakeCSVReader(self.files)
+        main.list_csv_files_by_service(
+            reader, self.config, ["auth-service", "career-service"], self.date
+        )
+        self.assertEqual(
+            reader.service_folders,
+            {
+                "dev-auth-service": "auth-service",
+                "dev-career-service": "career-service",
+            },
+        )
+
+    @unittest.skipUnless(HAS_CSV_READER_DEPS, "pandas/google-cloud-storage missing")
+    def test_default_template_groups_files(self):
+        reader = FakeCSVReader(self.files)
+        files_by_service = main.list_csv_files_by_service(
+            reader,
+            self.config,
+            ["auth-service", "career-service", "document-service"],
+            self.date,
+        )
+        self.assertEqual(
+            files_by_service,
+            {
+                "auth-service": self.files[:2],
+                "career-service": self.files[2:3],
+                "document-service": [],
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Tests for the SQLite run cache and how reruns use it
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+import main  # noqa: E402
+from run_cache import RunCache  # noqa: E402
+
+
+def _installed(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+class RunCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = RunCache(":memory:")
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_listing_round_trip(self):
+        listing = {"exports/a/users.csv": "11", "exports/a/roles.csv": None}
+        self.cache.store_listing("20240101", "auth", listing)
+
+        self.assertEqual(self.cache.get_listing("20240101", "auth"), listing)
+        self.assertEqual(
+            list(self.cache.get_listing("20240101", "auth")), list(listing)
+        )
+        self.assertIsNone(self.cache.get_listing("20240101", "career"))
+
+    def test_expired_listing_is_not_reused(self):
+        self.cache.store_listing("20240101", "auth", {"exports/a/users.csv": "1"})
+        self.cache.listing_ttl = -1
+        self.assertIsNone(self.cache.get_listing("20240101", "auth"))
+
+    def test_loaded_tables_only_returns_successes(self):
+        self.cache.mark_loaded("20240101", "auth", "users", True, "job-1")
+        self.cache.mark_loaded("20240101", "auth", "roles", False, "job-2")
+
+        self.assertEqual(self.cache.loaded_tables("20240101", "auth"), {"users"})
+
+    def test_later_failure_overrides_success(self):
+        self.cache.mark_loaded("20240101", "auth", "users", True, "job-1")
+        self.cache.mark_loaded("20240101", "auth", "users", False, "job-2")
+
+        self.assertEqual(self.cache.loaded_tables("20240101", "auth"), set())
+
+    def test_changed_file_versions_are_not_skipped(self):
+        versions = {"exports/a/users.csv": "1"}
+        self.cache.mark_loaded("20240101", "auth", "users", True, "job-1", versions)
+
+        self.assertEqual(
+            self.cache.loaded_tables("20240101", "auth", {"users": versions}),
+            {"users"},
+        )
+        self.assertEqual(
+            self.cache.loaded_tables(
+                "20240101", "auth", {"users": {"exports/a/users.csv": "2"}}
+            ),
+            set(),
+        )
+        self.assertEqual(
+            self.cache.loaded_tables(
+                "20240101", "auth", {"users": {"exports/a/users.csv": None}}
+            ),
+            set(),
+        )
+
+
+class FakeJob:
+    def __init__(self, table_name):
+        self.job_id = f"load-{table_name}"
+        self.location = "US"
+
+
+class FakeBigQueryClient:
+    def list_table_names(self, dataset_name):
+        return set()
+
+    def wait_loads(self, jobs):
+        return [True] * len(jobs)
+
+
+@unittest.skipUnless(_installed("google.api_core"), "google-api-core missing")
+class ProcessServiceSkipTablesTest(unittest.TestCase):
+    def test_skipped_tables_are_not_submitted(self):
+        submitted = []
+
+        def fake_submit_file_load(
+            bq_client,
+            config,
+            table_files,
+            dataset_name,
+            csv_reader,
+            existing_tables,
+            table_name,
+        ):
+            submitted.append(table_name)
+            return "create", FakeJob(table_name)
+
+        csv_files = [
+            "exports/dev-auth/users.csv",
+            "exports/dev-auth/roles.csv",
+            "exports/dev-auth/sessions.csv",
+        ]
+        with mock.patch.object(main, "submit_file_load", fake_submit_file_load):
+            result = main.process_service(
+                FakeBigQueryClient(),
+                None,
+                {},
+                "auth",
+                csv_files=csv_files,
+                dataset_name="dev_auth",
+                skip_tables={"users", "sessions"},
+            )
+
+        self.assertEqual(submitted, ["roles"])
+        self.assertEqual(result["files_processed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()